@@ -6,11 +6,10 @@ including version, author, and license information.
 """
 
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QIcon
 import os
 import sys
-from pathlib import Path
 
 class AboutDialog(QDialog):
     """About dialog that displays application information."""
@@ -24,7 +23,18 @@ class AboutDialog(QDialog):
         """
         super().__init__(parent)
         self.language_manager = language_manager
-        self.setWindowTitle(self.tr("About Nidec CommanderCDE"))
+        # Resolve all translated strings once up front with a single batch
+        # lookup; the dialog is static, so there is no reason to go through
+        # the per-key path again per widget
+        if language_manager is not None:
+            translated = language_manager.tr_many(("About Nidec CommanderCDE", "Close"))
+        else:
+            translated = {}
+        self._strings = {
+            'title': translated.get("About Nidec CommanderCDE", "About Nidec CommanderCDE"),
+            'close': translated.get("Close", "Close"),
+        }
+        self.setWindowTitle(self._strings['title'])
         self.setMinimumSize(400, 300)
         
         # Set window icon if available
@@ -75,7 +85,7 @@ class AboutDialog(QDialog):
         
         # Buttons
         button_layout = QHBoxLayout()
-        close_button = QPushButton("Close")
+        close_button = QPushButton(self._strings['close'])
         close_button.clicked.connect(self.accept)
         button_layout.addStretch()
         button_layout.addWidget(close_button)
@@ -5,35 +5,130 @@ This module provides the help system for the application, including the help dia
 and documentation viewer with dark theme support.
 """
 
-import os
-import sys
+import re
 from typing import Optional
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTextBrowser, 
                             QPushButton, QLabel, QApplication, QWidget, QFrame)
 from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtGui import QPalette, QColor
 
-# Add project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+# Languages offered by the help dialog: (code, native label)
+_LANGUAGES = (
+    ('en', 'English'),
+    ('it', 'Italiano'),
+)
 
-# Import language manager
-from script.lang.lang_manager import SimpleLanguageManager
+# Help pages are static per language, so they are built once at import time
+# and reused for every dialog open and language switch.
+_HELP_CONTENT_EN = """
+        <h1>Nidec CommanderCDE Help</h1>
+        
+        <div class="note">
+            <h4>Welcome to Nidec CommanderCDE</h4>
+            <p>This application allows you to control and monitor Nidec CDE series motor drives.</p>
+        </div>
+        
+        <h2>Getting Started</h2>
+        <ol>
+            <li>Connect your Nidec drive to your computer using the appropriate interface</li>
+            <li>Select the correct COM port from the connection menu</li>
+            <li>Click the <strong>Connect</strong> button to establish communication</li>
+        </ol>
+        
+        <h2>Features</h2>
+        <ul>
+            <li><strong>Real-time Monitoring:</strong> View current drive parameters</li>
+            <li><strong>Parameter Configuration:</strong> Adjust drive settings</li>
+            <li><strong>Fault Diagnostics:</strong> View and clear drive faults</li>
+            <li><strong>Data Logging:</strong> Record and export drive data</li>
+        </ul>
+        
+        <div class="warning">
+            <h4>Important Safety Notice</h4>
+            <p>Always follow proper safety procedures when working with motor drives. Ensure the drive is properly grounded and all connections are secure before powering on.</p>
+        </div>
+        
+        <h2>Keyboard Shortcuts</h2>
+        <ul>
+            <li><code>Ctrl+O</code>: Open connection dialog</li>
+            <li><code>Ctrl+D</code>: Disconnect from drive</li>
+            <li><code>F1</code>: Show this help</li>
+            <li><code>Esc</code>: Close dialogs</li>
+        </ul>
+        
+        """
+
+_HELP_CONTENT_IT = """
+        <h1>Guida di Nidec CommanderCDE</h1>
+        
+        <div class="note">
+            <h4>Benvenuti in Nidec CommanderCDE</h4>
+            <p>Questa applicazione ti permette di controllare e monitorare gli azionamenti Nidec serie CDE.</p>
+        </div>
+        
+        <h2>Per Iniziare</h2>
+        <ol>
+            <li>Collega il tuo azionamento Nidec al computer utilizzando l'interfaccia appropriata</li>
+            <li>Seleziona la porta COM corretta dal menu di connessione</li>
+            <li>Clicca sul pulsante <strong>Connetti</strong> per stabilire la comunicazione</li>
+        </ol>
+        
+        <h2>Funzionalità</h2>
+        <ul>
+            <li><strong>Monitoraggio in Tempo Reale:</strong> Visualizza i parametri correnti dell'azionamento</li>
+            <li><strong>Configurazione Parametri:</strong> Modifica le impostazioni dell'azionamento</li>
+            <li><strong>Diagnostica Guasti:</strong> Visualizza e cancella i guasti dell'azionamento</li>
+            <li><strong>Registrazione Dati:</strong> Registra ed esporta i dati dell'azionamento</li>
+        </ul>
+        
+        <div class="warning">
+            <h4>Avviso di Sicurezza Importante</h4>
+            <p>Segui sempre le corrette procedure di sicurezza quando lavori con gli azionamenti. Assicurati che l'azionamento sia correttamente messo a terra e che tutti i collegamenti siano sicuri prima di accenderlo.</p>
+        </div>
+        
+        <h2>Scorciatoie da Tastiera</h2>
+        <ul>
+            <li><code>Ctrl+O</code>: Apri la finestra di connessione</li>
+            <li><code>Ctrl+D</code>: Disconnetti dall'azionamento</li>
+            <li><code>F1</code>: Mostra questa guida</li>
+            <li><code>Esc</code>: Chiudi le finestre di dialogo</li>
+        </ul>
+        
+        """
+
+# Collapse the pretty-printing whitespace once at import; fewer tokens for
+# QTextDocument's HTML parser on every setHtml. The pages contain no <pre>
+# blocks, so whitespace runs are insignificant.
+_HELP_CONTENT = {
+    'en': re.sub(r"\s+", " ", _HELP_CONTENT_EN).strip(),
+    'it': re.sub(r"\s+", " ", _HELP_CONTENT_IT).strip(),
+}
 
 class HelpWindow(QDialog):
     """Help window that displays application documentation with dark theme."""
     
+    # Shared instance so repeated opens reuse the built dialog
+    _instance = None
+    
     @staticmethod
     def show_help(parent=None, lang='en'):
         """Static method to show the help window.
         
+        The window is built on the first call and reused afterwards, so
+        repeated opens skip widget construction and HTML parsing.
+        
         Args:
             parent: Parent widget
             lang: Language code ('en' or 'it')
         """
-        dialog = HelpWindow(parent, lang)
-        dialog.exec()
+        dialog = HelpWindow._instance
+        if dialog is None:
+            dialog = HelpWindow._instance = HelpWindow(parent, lang)
+        elif dialog.lang != lang:
+            dialog.change_language(lang)
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
     
     def __init__(self, parent=None, lang='en'):
         """Initialize the help window.
@@ -74,10 +169,9 @@ class HelpWindow(QDialog):
         lang_layout = QHBoxLayout()
         lang_layout.addStretch()
         
-        # Language buttons
-        en_btn = QPushButton("English")
-        it_btn = QPushButton("Italiano")
-        
+        # Language buttons, driven by the module-level table so adding a
+        # language is a one-line change and no per-button closure is written
+        # out by hand
         # Style language buttons
         btn_style = """
             QPushButton {
@@ -98,21 +192,16 @@ class HelpWindow(QDialog):
             }
         """
         
-        en_btn.setStyleSheet(btn_style)
-        it_btn.setStyleSheet(btn_style)
-        en_btn.setCheckable(True)
-        it_btn.setCheckable(True)
-        
-        if self.lang == 'en':
-            en_btn.setChecked(True)
-        else:
-            it_btn.setChecked(True)
-        
-        en_btn.clicked.connect(lambda: self.change_language('en'))
-        it_btn.clicked.connect(lambda: self.change_language('it'))
-        
-        lang_layout.addWidget(en_btn)
-        lang_layout.addWidget(it_btn)
+        self.lang_buttons = {}
+        for lang_code, lang_label in _LANGUAGES:
+            btn = QPushButton(lang_label)
+            btn.setStyleSheet(btn_style)
+            btn.setCheckable(True)
+            btn.setChecked(lang_code == self.lang)
+            btn.setProperty("lang", lang_code)
+            btn.clicked.connect(self._on_language_clicked)
+            lang_layout.addWidget(btn)
+            self.lang_buttons[lang_code] = btn
         content_layout.addLayout(lang_layout)
         
         # Help content
@@ -215,6 +304,10 @@ class HelpWindow(QDialog):
         palette.setColor(QPalette.ColorRole.HighlightedText, QColor(40, 42, 54))
         self.setPalette(palette)
     
+    def _on_language_clicked(self):
+        """Shared slot for the language buttons; reads the sender's code."""
+        self.change_language(self.sender().property("lang"))
+
     def change_language(self, new_lang):
         """Change the current language.
         
@@ -223,92 +316,12 @@ class HelpWindow(QDialog):
         """
         if new_lang != self.lang:
             self.lang = new_lang
+            for lang_code, btn in self.lang_buttons.items():
+                btn.setChecked(lang_code == new_lang)
             self.browser.setHtml(self.get_help_content())
             self.close_btn.setText("Close" if new_lang == 'en' else "Chiudi")
             self.setWindowTitle("Nidec CommanderCDE - Help" if new_lang == 'en' else "Nidec CommanderCDE - Aiuto")
     
     def get_help_content(self):
         """Get the help content in the current language."""
-        if self.lang == 'it':
-            return self.get_italian_help()
-        return self.get_english_help()
-    
-    def get_english_help(self):
-        """Return English help content."""
-        return """
-        <h1>Nidec CommanderCDE Help</h1>
-        
-        <div class="note">
-            <h4>Welcome to Nidec CommanderCDE</h4>
-            <p>This application allows you to control and monitor Nidec CDE series motor drives.</p>
-        </div>
-        
-        <h2>Getting Started</h2>
-        <ol>
-            <li>Connect your Nidec drive to your computer using the appropriate interface</li>
-            <li>Select the correct COM port from the connection menu</li>
-            <li>Click the <strong>Connect</strong> button to establish communication</li>
-        </ol>
-        
-        <h2>Features</h2>
-        <ul>
-            <li><strong>Real-time Monitoring:</strong> View current drive parameters</li>
-            <li><strong>Parameter Configuration:</strong> Adjust drive settings</li>
-            <li><strong>Fault Diagnostics:</strong> View and clear drive faults</li>
-            <li><strong>Data Logging:</strong> Record and export drive data</li>
-        </ul>
-        
-        <div class="warning">
-            <h4>Important Safety Notice</h4>
-            <p>Always follow proper safety procedures when working with motor drives. Ensure the drive is properly grounded and all connections are secure before powering on.</p>
-        </div>
-        
-        <h2>Keyboard Shortcuts</h2>
-        <ul>
-            <li><code>Ctrl+O</code>: Open connection dialog</li>
-            <li><code>Ctrl+D</code>: Disconnect from drive</li>
-            <li><code>F1</code>: Show this help</li>
-            <li><code>Esc</code>: Close dialogs</li>
-        </ul>
-        
-        """
-    
-    def get_italian_help(self):
-        """Return Italian help content."""
-        return """
-        <h1>Guida di Nidec CommanderCDE</h1>
-        
-        <div class="note">
-            <h4>Benvenuti in Nidec CommanderCDE</h4>
-            <p>Questa applicazione ti permette di controllare e monitorare gli azionamenti Nidec serie CDE.</p>
-        </div>
-        
-        <h2>Per Iniziare</h2>
-        <ol>
-            <li>Collega il tuo azionamento Nidec al computer utilizzando l'interfaccia appropriata</li>
-            <li>Seleziona la porta COM corretta dal menu di connessione</li>
-            <li>Clicca sul pulsante <strong>Connetti</strong> per stabilire la comunicazione</li>
-        </ol>
-        
-        <h2>Funzionalità</h2>
-        <ul>
-            <li><strong>Monitoraggio in Tempo Reale:</strong> Visualizza i parametri correnti dell'azionamento</li>
-            <li><strong>Configurazione Parametri:</strong> Modifica le impostazioni dell'azionamento</li>
-            <li><strong>Diagnostica Guasti:</strong> Visualizza e cancella i guasti dell'azionamento</li>
-            <li><strong>Registrazione Dati:</strong> Registra ed esporta i dati dell'azionamento</li>
-        </ul>
-        
-        <div class="warning">
-            <h4>Avviso di Sicurezza Importante</h4>
-            <p>Segui sempre le corrette procedure di sicurezza quando lavori con gli azionamenti. Assicurati che l'azionamento sia correttamente messo a terra e che tutti i collegamenti siano sicuri prima di accenderlo.</p>
-        </div>
-        
-        <h2>Scorciatoie da Tastiera</h2>
-        <ul>
-            <li><code>Ctrl+O</code>: Apri la finestra di connessione</li>
-            <li><code>Ctrl+D</code>: Disconnetti dall'azionamento</li>
-            <li><code>F1</code>: Mostra questa guida</li>
-            <li><code>Esc</code>: Chiudi le finestre di dialogo</li>
-        </ul>
-        
-        """
+        return _HELP_CONTENT.get(self.lang) or _HELP_CONTENT['en']
@@ -197,8 +197,8 @@ class MainWindow(QMainWindow):
         
         # Add available languages
         for lang_info in language_manager.get_available_languages():
-            lang_code = lang_info['code']
-            lang_name = lang_info['name']
+            lang_code = lang_info.code
+            lang_name = lang_info.name
             action = QAction(lang_name, self, checkable=True)
             action.setData(lang_code)
             action.triggered.connect(self.change_language)
@@ -265,8 +265,7 @@ class MainWindow(QMainWindow):
     
     def show_help(self):
         from script.UI.help import HelpWindow
-        self.help_window = HelpWindow(self, self.current_language)
-        self.help_window.show()
+        HelpWindow.show_help(self, self.current_language)
         
     def open_wiki(self):
         """Open the project wiki in the default web browser."""
@@ -284,9 +283,9 @@ class MainWindow(QMainWindow):
             )
     
     def show_about(self):
-        """Show the about dialog."""
+        """Show the about dialog, reusing the cached instance when possible."""
         if not hasattr(self, 'about_dialog') or not self.about_dialog:
-            self.about_dialog = AboutDialog(self)
+            self.about_dialog = AboutDialog(self, self.language_manager)
         self.about_dialog.exec()
         
     def show_sponsor(self):
@@ -467,7 +466,10 @@ class MainWindow(QMainWindow):
         if lang_code != self.current_language:
             self.current_language = lang_code
             self.settings.setValue("language", lang_code)
-            
+
+            # Drop the cached About dialog so it is rebuilt in the new language
+            self.about_dialog = None
+
             # Update the language menu check state
             if hasattr(self, 'language_group'):
                 for action in self.language_group.actions():
@@ -46,7 +46,7 @@ try:
         QSplitter, QToolBar, QStyle, QFileDialog, QDialog, QLineEdit, QFormLayout,
         QDialogButtonBox, QListWidget, QListWidgetItem, QAbstractItemView
     )
-    from PyQt6.QtCore import Qt, QTimer, QSize, QDateTime, QPoint, QRectF
+    from PyQt6.QtCore import Qt, QTimer, QSize, QDateTime, QPoint, QRectF, pyqtSignal
     from PyQt6.QtGui import (
         QIcon, QFont, QTextCursor, QPalette, QColor, QPainter, QPen, QBrush,
         QLinearGradient, QFontMetrics, QAction, QKeySequence
@@ -138,20 +138,20 @@ class ParameterWidget(QWidget):
         layout.setContentsMargins(5, 2, 5, 2)
         layout.setSpacing(2)
         
-        # Name label
+        # Name label (styled via the window-level stylesheet by objectName)
         self.name_label = QLabel(self.name)
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.name_label.setStyleSheet("font-weight: bold;")
-        
+        self.name_label.setObjectName("paramName")
+
         # Value label
         self.value_label = QLabel("0.00")
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.value_label.setStyleSheet("font-size: 14px;")
-        
+        self.value_label.setObjectName("paramValue")
+
         # Unit label
         self.unit_label = QLabel(self.unit)
         self.unit_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.unit_label.setStyleSheet("color: gray;")
+        self.unit_label.setObjectName("paramUnit")
         
         # Add widgets to layout
         layout.addWidget(self.name_label)
@@ -173,7 +173,12 @@ class SimulatorWidget(QMainWindow):
     This class provides a comprehensive graphical interface to simulate and monitor
     the behavior of a Nidec drive for testing purposes.
     """
-    
+
+    # Signals used to marshal inverter callbacks (fired on the simulator's
+    # background thread) onto the Qt event loop before any widget is touched
+    inverter_state_changed = pyqtSignal(object)
+    inverter_alarm = pyqtSignal(object)
+
     def __init__(self, parent=None):
         """Initialize the simulator window."""
         super().__init__(parent)
@@ -337,6 +342,31 @@ class SimulatorWidget(QMainWindow):
                 border-right: 1px solid #3a3a3a;
                 border-bottom: 1px solid #3a3a3a;
             }
+
+            /* Named labels - one parse here instead of per-widget setStyleSheet */
+            QLabel#paramName {
+                font-weight: bold;
+            }
+            QLabel#paramValue {
+                font-size: 14px;
+            }
+            QLabel#paramUnit {
+                color: gray;
+            }
+            QLabel#freqDisplay {
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QLabel#gaugeValue {
+                font-size: 36px;
+                font-weight: bold;
+            }
+            QLabel#panelValue {
+                font-size: 24px;
+            }
+            QLabel#alarmLabel[state="alarm"] {
+                color: red;
+            }
         """)
         
         # Ensure logs directory exists at the root of the application
@@ -347,6 +377,25 @@ class SimulatorWidget(QMainWindow):
         self.log_file = str(self._log_dir / "simulator_log.csv")
         self.log_interval = 1.0  # seconds
         self.last_log_time = 0
+
+        # Last displayed values, quantized to display resolution, so update_ui
+        # can skip formatting and setText when the shown text would not change
+        self._last_speed_int = None
+        self._last_freq_int = None
+        self._last_current_int = None
+        self._last_volt_int = None
+        self._last_power_int = None
+        self._last_temp_int = None
+        self._last_stato = None
+
+        # Coalescing timer for frequency changes: dragging the slider fires
+        # valueChanged for every intermediate value, but only the final one
+        # needs to reach the inverter (and the log)
+        self._pending_freq = None
+        self._freq_commit = QTimer(self)
+        self._freq_commit.setSingleShot(True)
+        self._freq_commit.setInterval(50)
+        self._freq_commit.timeout.connect(self._commit_frequency)
         
         # Setup UI
         self.init_ui()
@@ -532,6 +581,7 @@ class SimulatorWidget(QMainWindow):
         self.alarm_led = LedIndicator()
         self.alarm_led.set_color("red")
         self.alarm_label = QLabel("No Alarms")
+        self.alarm_label.setObjectName("alarmLabel")
         self.alarm_label.setWordWrap(True)
         
         alarm_status = QHBoxLayout()
@@ -584,7 +634,7 @@ class SimulatorWidget(QMainWindow):
         freq_display_layout = QHBoxLayout()
         self.freq_display_main = QLabel("0.0")
         self.freq_display_main.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.freq_display_main.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.freq_display_main.setObjectName("freqDisplay")
         freq_unit = QLabel("Hz")
         
         freq_display_layout.addStretch()
@@ -660,7 +710,7 @@ class SimulatorWidget(QMainWindow):
         
         self.speed_gauge = QLabel("0")
         self.speed_gauge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.speed_gauge.setStyleSheet("font-size: 36px; font-weight: bold;")
+        self.speed_gauge.setObjectName("gaugeValue")
         
         speed_unit = QLabel("RPM")
         speed_unit.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -675,7 +725,7 @@ class SimulatorWidget(QMainWindow):
         
         self.freq_value = QLabel("0.00")
         self.freq_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.freq_value.setStyleSheet("font-size: 36px; font-weight: bold;")
+        self.freq_value.setObjectName("gaugeValue")
         
         freq_unit = QLabel("Hz")
         freq_unit.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -690,7 +740,7 @@ class SimulatorWidget(QMainWindow):
         
         self.current_value = QLabel("0.00")
         self.current_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.current_value.setStyleSheet("font-size: 36px; font-weight: bold;")
+        self.current_value.setObjectName("gaugeValue")
         
         current_unit = QLabel("A")
         current_unit.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -713,7 +763,7 @@ class SimulatorWidget(QMainWindow):
         
         self.voltage_value = QLabel("0.0")
         self.voltage_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.voltage_value.setStyleSheet("font-size: 24px;")
+        self.voltage_value.setObjectName("panelValue")
         
         voltage_unit = QLabel("V")
         voltage_unit.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -728,7 +778,7 @@ class SimulatorWidget(QMainWindow):
         
         self.power_value = QLabel("0.00")
         self.power_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.power_value.setStyleSheet("font-size: 24px;")
+        self.power_value.setObjectName("panelValue")
         
         power_unit = QLabel("kW")
         power_unit.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -743,7 +793,7 @@ class SimulatorWidget(QMainWindow):
         
         self.temp_value = QLabel("25.0")
         self.temp_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.temp_value.setStyleSheet("font-size: 24px;")
+        self.temp_value.setObjectName("panelValue")
         
         temp_unit = QLabel("°C")
         temp_unit.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -848,21 +898,20 @@ class SimulatorWidget(QMainWindow):
         
     def setup_connections(self):
         """Set up signal-slot connections."""
-        # Connect inverter state change callbacks
-        self.inverter.add_state_change_callback(self.on_inverter_state_changed)
-        self.inverter.add_alarm_callback(self.on_inverter_alarm)
-        
+        # Connect inverter callbacks through signals: the simulator updates its
+        # state on a background thread, so widget access must happen via the
+        # queued signal-slot path on the UI thread
+        self.inverter.add_state_change_callback(self.inverter_state_changed.emit)
+        self.inverter.add_alarm_callback(self.inverter_alarm.emit)
+        self.inverter_state_changed.connect(self.on_inverter_state_changed)
+        self.inverter_alarm.connect(self.on_inverter_alarm)
+
         # Connect UI controls
         self.start_btn.clicked.connect(self.start_inverter)
         self.stop_btn.clicked.connect(self.stop_inverter)
-        
+
         # Log level filter
         self.log_level_combo.currentTextChanged.connect(self.filter_log)
-        
-        # Set up periodic updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_ui)
-        self.update_timer.start(100)  # 10 Hz update rate
     
     def on_inverter_state_changed(self, state):
         """Handle inverter state changes.
@@ -897,44 +946,73 @@ class SimulatorWidget(QMainWindow):
     def update_ui(self):
         """Update the UI with current inverter state."""
         try:
-            # Update dashboard values
-            self.speed_gauge.setText(f"{int(self.inverter.velocita_motore)}")
-            self.freq_value.setText(f"{self.inverter.frequenza_uscita:.2f}")
-            self.current_value.setText(f"{self.inverter.corrente_uscita:.2f}")
-            self.voltage_value.setText(f"{self.inverter.tensione_uscita:.1f}")
-            self.power_value.setText(f"{self.inverter.potenza_uscita:.2f}")
-            self.temp_value.setText(f"{self.inverter.temperatura:.1f}")
-            
-            # Update state indicator
-            state_text = self.inverter.stato.name.replace('_', ' ').title()
-            self.state_label.setText(state_text)
+            # Update dashboard values. Compare integer-quantized values against
+            # the last displayed ones so unchanged labels skip both the string
+            # formatting and the setText call.
+            speed_int = int(self.inverter.velocita_motore)
+            if speed_int != self._last_speed_int:
+                self._last_speed_int = speed_int
+                self.speed_gauge.setText(f"{speed_int}")
+
+            freq_int = round(self.inverter.frequenza_uscita * 100)
+            if freq_int != self._last_freq_int:
+                self._last_freq_int = freq_int
+                self.freq_value.setText(f"{freq_int / 100:.2f}")
+
+            current_int = round(self.inverter.corrente_uscita * 100)
+            if current_int != self._last_current_int:
+                self._last_current_int = current_int
+                self.current_value.setText(f"{current_int / 100:.2f}")
+
+            volt_int = round(self.inverter.tensione_uscita * 10)
+            if volt_int != self._last_volt_int:
+                self._last_volt_int = volt_int
+                self.voltage_value.setText(f"{volt_int / 10:.1f}")
+
+            power_int = round(self.inverter.potenza_uscita * 100)
+            if power_int != self._last_power_int:
+                self._last_power_int = power_int
+                self.power_value.setText(f"{power_int / 100:.2f}")
+
+            temp_int = round(self.inverter.temperatura * 10)
+            if temp_int != self._last_temp_int:
+                self._last_temp_int = temp_int
+                self.temp_value.setText(f"{temp_int / 10:.1f}")
             
-            # Update state LED
-            if self.inverter.stato == StatoInverter.IN_MARCIA:
-                self.state_led.set_color("green")
-                self.state_led.set_state(True)
-            elif self.inverter.stato == StatoInverter.ALLARME:
-                self.state_led.set_color("red")
-                self.state_led.set_state(True)
-            elif self.inverter.stato == StatoInverter.ACCELERAZIONE:
-                self.state_led.set_color("yellow")
-                self.state_led.set_state(True)
-            elif self.inverter.stato == StatoInverter.DECELERAZIONE:
-                self.state_led.set_color("yellow")
-                self.state_led.set_state(True)
-            else:
-                self.state_led.set_color("gray")
-                self.state_led.set_state(False)
+            # Update state indicator only when the state actually changed;
+            # the text and LED are identical on consecutive ticks otherwise
+            stato = self.inverter.stato
+            if stato != self._last_stato:
+                self._last_stato = stato
+                self.state_label.setText(stato.name.replace('_', ' ').title())
+
+                # Update state LED
+                if stato == StatoInverter.IN_MARCIA:
+                    self.state_led.set_color("green")
+                    self.state_led.set_state(True)
+                elif stato == StatoInverter.ALLARME:
+                    self.state_led.set_color("red")
+                    self.state_led.set_state(True)
+                elif stato == StatoInverter.ACCELERAZIONE:
+                    self.state_led.set_color("yellow")
+                    self.state_led.set_state(True)
+                elif stato == StatoInverter.DECELERAZIONE:
+                    self.state_led.set_color("yellow")
+                    self.state_led.set_state(True)
+                else:
+                    self.state_led.set_color("gray")
+                    self.state_led.set_state(False)
             
-            # Update alarm indicator
+            # Update alarm indicator (color comes from the window stylesheet via
+            # the 'state' property, so no stylesheet re-parse per update)
             if self.inverter.allarme_attivo:
                 self.alarm_led.set_state(True)
                 self.alarm_label.setText(self.inverter.descrizione_allarme)
-                self.alarm_label.setStyleSheet("color: red;")
+                self._set_alarm_label_state("alarm")
             else:
                 self.alarm_led.set_state(False)
                 self.alarm_label.setText("No Alarms")
-                self.alarm_label.setStyleSheet("")
+                self._set_alarm_label_state("")
             
             # Update control buttons
             is_running = self.inverter.stato in [StatoInverter.IN_MARCIA, StatoInverter.ACCELERAZIONE]
@@ -952,6 +1030,14 @@ class SimulatorWidget(QMainWindow):
         except Exception as e:
             self.log_message(f"Error updating UI: {str(e)}", "ERROR")
     
+    def _set_alarm_label_state(self, state: str):
+        """Switch the alarm label style by dynamic property instead of re-parsing a stylesheet."""
+        if self.alarm_label.property("state") != state:
+            self.alarm_label.setProperty("state", state)
+            style = self.alarm_label.style()
+            style.unpolish(self.alarm_label)
+            style.polish(self.alarm_label)
+
     def update_status(self):
         """Update the status bar with current information."""
         try:
@@ -1036,7 +1122,11 @@ class SimulatorWidget(QMainWindow):
             self.log_table.setItem(row, 1, level_item)
             self.log_table.setItem(row, 2, source_item)
             self.log_table.setItem(row, 3, msg_item)
-            
+
+            # Limit to 1000 rows so per-message layout work stays bounded
+            while self.log_table.rowCount() > 1000:
+                self.log_table.removeRow(0)
+
             # Auto-scroll to bottom
             self.log_table.scrollToBottom()
             
@@ -1185,9 +1275,18 @@ class SimulatorWidget(QMainWindow):
         frequency = value / 10.0  # Convert from 0.1 Hz steps to Hz
         self.freq_display.setText(f"{frequency:.1f}")
         self.freq_display_main.setText(f"{frequency:.1f}")
-        
-        # Only update inverter if running
+
+        # Only update inverter if running; coalesce rapid slider movements so
+        # only the final value is committed to the inverter
         if self.inverter.stato in [StatoInverter.IN_MARCIA, StatoInverter.ACCELERAZIONE]:
+            self._pending_freq = frequency
+            self._freq_commit.start()
+
+    def _commit_frequency(self):
+        """Commit the last pending frequency change to the inverter."""
+        if self._pending_freq is not None:
+            frequency = self._pending_freq
+            self._pending_freq = None
             self.set_frequency(frequency)
     
     def show_fault_injection_dialog(self):
@@ -1373,6 +1472,18 @@ class SimulatorWidget(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save log file: {str(e)}")
 
+# Reusable message box for fatal errors: constructed once on first use so the
+# crash path does not have to allocate a full dialog every time
+_FATAL_BOX = None
+
+def _show_fatal_error(message: str):
+    """Show a fatal error dialog, reusing a single QMessageBox instance."""
+    global _FATAL_BOX
+    if _FATAL_BOX is None:
+        _FATAL_BOX = QMessageBox(QMessageBox.Icon.Critical, "Critical Error", "")
+    _FATAL_BOX.setText(message)
+    _FATAL_BOX.exec()
+
 def run_simulator():
     """
     Run the simulator as a standalone application.
@@ -1411,7 +1522,7 @@ def run_simulator():
         
         # Show error message
         error_msg = f"A critical error occurred while starting the simulator:\n{str(e)}\n\nPlease check the log file for details."
-        QMessageBox.critical(None, "Critical Error", error_msg)
+        _show_fatal_error(error_msg)
         return 1
 
 if __name__ == '__main__':
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton,
                              QGridLayout, QSizePolicy)
 from PyQt6.QtCore import Qt, QUrl, QSize, QBuffer, QTimer
 from PyQt6.QtGui import QPixmap, QDesktopServices, QImage, QIcon
+import functools
 import webbrowser
 import os
 import io
@@ -25,6 +26,54 @@ from script.lang.lang_manager import SimpleLanguageManager
 
 logger = logging.getLogger(__name__)
 
+# Donation targets are fixed, so the QUrl objects are built once and shared
+# by every dialog instead of re-parsed on each button click
+_GITHUB_SPONSORS_URL = QUrl("https://github.com/sponsors/Nsfr750")
+_PAYPAL_URL = QUrl("https://paypal.me/3dmega")
+
+# Stylesheets are static, so build the strings once instead of per dialog
+# open; Qt re-parses QSS per widget either way, but the literals and their
+# allocations are shared
+_MONERO_ADDRESS_QSS = """
+    QLabel {
+        font-family: monospace;
+        background-color: #f0f0f0;
+        color: #000;
+        padding: 5px;
+        border-radius: 3px;
+        border: 1px solid #ddd;
+    }
+"""
+
+_PAYPAL_BTN_QSS = """
+    QPushButton {
+        background-color: #0079C1;
+        color: white;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #0062A3;
+    }
+"""
+
+_MONERO_BTN_QSS = """
+    QPushButton {
+        background-color: #F26822;
+        color: white;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+        margin-right: 10px;
+    }
+    QPushButton:hover {
+        background-color: #D45B1D;
+    }
+"""
+
 class SponsorDialog(QDialog):
     def __init__(self, parent=None, language_manager=None):
         super().__init__(parent)
@@ -75,16 +124,7 @@ class SponsorDialog(QDialog):
         monero_label = QLabel(self.tr("sponsor.monero.label", "Monero:"))
         monero_xmr= "XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR XMR"
         monero_address_label = QLabel(monero_xmr)
-        monero_address_label.setStyleSheet("""
-            QLabel {
-                font-family: monospace;
-                background-color: #f0f0f0;
-                color: #000;
-                padding: 5px;
-                border-radius: 3px;
-                border: 1px solid #ddd;
-            }
-        """)
+        monero_address_label.setStyleSheet(_MONERO_ADDRESS_QSS)
         
         # Generate QR Code
         qr = qrcode.QRCode(
@@ -173,38 +213,14 @@ class SponsorDialog(QDialog):
         
         # Donate button
         donate_btn = QPushButton(self.tr("sponsor.buttons.donate_paypal", "Donate with PayPal"))
-        donate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0079C1;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0062A3;
-            }
-        """)
+        donate_btn.setStyleSheet(_PAYPAL_BTN_QSS)
         donate_btn.clicked.connect(self.open_paypal_link)
         
         # Copy Monero address button
         self.copy_monero_btn = QPushButton(self.tr("sponsor.buttons.copy_monero", "Copy Monero Address"))
-        self.copy_monero_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F26822;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                margin-right: 10px;
-            }
-            QPushButton:hover {
-                background-color: #D45B1D;
-            }
-        """)
-        self.copy_monero_btn.clicked.connect(lambda: self.copy_to_clipboard(monero_address))
+        self.copy_monero_btn.setStyleSheet(_MONERO_BTN_QSS)
+        self.copy_monero_btn.clicked.connect(
+            functools.partial(self.copy_to_clipboard, monero_address))
         
         button_layout.addWidget(close_btn)
         button_layout.addStretch()
@@ -215,11 +231,11 @@ class SponsorDialog(QDialog):
     
     def open_donation_link(self):
         """Open donation link in default web browser."""
-        QDesktopServices.openUrl(QUrl("https://github.com/sponsors/Nsfr750"))
-    
+        QDesktopServices.openUrl(_GITHUB_SPONSORS_URL)
+
     def open_paypal_link(self):
         """Open PayPal link in default web browser."""
-        QDesktopServices.openUrl(QUrl("https://paypal.me/3dmega"))
+        QDesktopServices.openUrl(_PAYPAL_URL)
     
     def copy_to_clipboard(self, text):
         """Copy text to clipboard and show a tooltip."""
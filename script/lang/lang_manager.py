@@ -8,13 +8,20 @@ and managing the current application language.
 import os
 import json
 import importlib
+import re
 import sys
+import types
+from collections import namedtuple
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
 from script.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Lightweight entry for the available-languages list; cheaper than a dict
+# per locale and immutable by construction
+LangInfo = namedtuple('LangInfo', ('code', 'name'))
+
 class SimpleLanguageManager(QObject):
     """A simple language manager that loads translations from Python modules.
     
@@ -44,13 +51,23 @@ class SimpleLanguageManager(QObject):
         self.translations = {}
         self.available_languages = []
         self.current_language = 'en'  # Default language
+        # Language files found by the scan, parsed lazily on first use
+        self._lang_files = {}
+        # Table for the current language, refreshed on switch so tr() does a
+        # single-level lookup on the common no-lang_code path
+        self._active = {}
         self._load_languages()
         
         # Load default language
         self.load_language(self.current_language)
     
     def _load_languages(self):
-        """Load all available language modules."""
+        """Scan for available language modules without parsing them.
+
+        Only the filenames and the language display names are read here;
+        the full TRANSLATIONS tables are parsed on first use, so startup
+        cost no longer scales with the number of shipped locales.
+        """
         try:
             # In development, __file__ is the .py file, in compiled it's in a different location
             if getattr(sys, 'frozen', False):
@@ -61,16 +78,16 @@ class SimpleLanguageManager(QObject):
                 # Running in development mode
                 lang_dir = self.lang_dir
             
-            # Look for Python language modules in the lang directory
-            lang_files = [f for f in lang_dir.glob('lang_*.py') 
-                         if f.name not in ['lang_manager.py', '__init__.py']]
+            # Look for Python language modules in the lang directory; the
+            # two-letter pattern matches ISO 639-1 modules like lang_en.py
+            # and already excludes lang_manager.py, so no post-filter pass
+            lang_files = sorted(lang_dir.glob('lang_??.py'))
             
             if not lang_files:
                 # Try alternative path for compiled version
                 if lang_dir != self.lang_dir:
                     lang_dir = self.lang_dir
-                    lang_files = [f for f in lang_dir.glob('lang_*.py') 
-                                if f.name not in ['lang_manager.py', '__init__.py']]
+                    lang_files = sorted(lang_dir.glob('lang_??.py'))
                 
                 if not lang_files:
                     logger.warning(f"No language modules found in {lang_dir}")
@@ -80,53 +97,125 @@ class SimpleLanguageManager(QObject):
                 try:
                     # Extract language code from filename (e.g., 'en' from 'lang_en.py')
                     lang_code = lang_file.stem.split('_', 1)[1]
+                    self._lang_files[lang_code] = lang_file
                     
-                    # Read the file content
-                    with open(lang_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    # Pull just the display name out of the file text;
+                    # reading it is cheap, it is the parse we are deferring
+                    name = lang_code.upper()
+                    try:
+                        with open(lang_file, 'r', encoding='utf-8') as f:
+                            content = f.read()
+                        match = re.search(r"'language_name'\s*:\s*'([^']+)'", content)
+                        if match:
+                            name = match.group(1)
+                    except OSError:
+                        pass
                     
-                    # Extract the TRANSLATIONS dictionary using a simple approach
-                    translations = {}
-                    if 'TRANSLATIONS' in content:
-                        # This is a simple approach - for more complex cases, consider using ast.literal_eval
-                        # or a proper parser
-                        start = content.find('TRANSLATIONS = {') + len('TRANSLATIONS = ')
-                        end = content.rfind('}') + 1
-                        if start > 0 and end > 0:
-                            try:
-                                # Use a safe way to evaluate the dictionary
-                                import ast
-                                translations = ast.literal_eval(content[start:end])
-                            except (SyntaxError, ValueError) as e:
-                                logger.error(f"Error parsing translations in {lang_file}: {e}")
-                                continue
-                    
-                    if translations:
-                        self.translations[lang_code] = translations
-                        self.available_languages.append({
-                            'code': lang_code,
-                            'name': translations.get('language_name', lang_code.upper())
-                        })
-                        logger.info(f"Loaded language: {lang_code}")
-                    else:
-                        logger.error(f"No valid translations found in {lang_file}")
-                        
+                    self.available_languages.append(LangInfo(lang_code, name))
                 except Exception as e:
-                    logger.error(f"Error loading language file {lang_file}: {e}")
+                    logger.error(f"Error scanning language file {lang_file}: {e}")
             
-            if not self.translations:
+            if not self._lang_files:
                 logger.error("No valid language modules found")
                 return
                 
             # Set default language if available
-            if 'en' in self.translations:
-                self.current_language = 'en'
-            else:
-                self.current_language = next(iter(self.translations.keys()))
+            if 'en' not in self._lang_files:
+                self.current_language = next(iter(self._lang_files))
                 
         except Exception as e:
             logger.error(f"Error initializing language manager: {e}")
     
+    def _ensure_loaded(self, lang_code):
+        """Parse and cache the table for a language on first use.
+        
+        Args:
+            lang_code (str): Language code to load
+            
+        Returns:
+            bool: True if the table is available, False otherwise
+        """
+        if lang_code in self.translations:
+            return True
+        
+        lang_file = self._lang_files.get(lang_code)
+        if lang_file is None:
+            return False
+        
+        try:
+            translations = self._parse_lang_file(lang_file)
+        except Exception as e:
+            logger.error(f"Error loading language file {lang_file}: {e}")
+            return False
+        
+        if not translations:
+            logger.error(f"No valid translations found in {lang_file}")
+            return False
+        
+        # Intern keys (and string values) so the frequent tr() lookups
+        # compare dict keys by identity instead of hashing the full string
+        # each time
+        translations = {
+            sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+            for key, value in translations.items()
+        }
+        # Read-only view: the tables are shared across the whole UI, so
+        # nothing may mutate them in place
+        self.translations[lang_code] = types.MappingProxyType(translations)
+        logger.info(f"Loaded language: {lang_code}")
+        return True
+    
+    def _parse_lang_file(self, lang_file):
+        """Parse the TRANSLATIONS dict out of a language module.
+        
+        Args:
+            lang_file (Path): Path to the lang_XX.py module
+            
+        Returns:
+            dict: The parsed translations, or an empty dict on failure
+        """
+        # Prefer a JSON sidecar cache: json.loads is an order of magnitude
+        # faster than ast.literal_eval and this parse runs on the UI thread
+        cache_file = lang_file.with_suffix('.json')
+        translations = {}
+        try:
+            if (cache_file.exists()
+                    and cache_file.stat().st_mtime >= lang_file.stat().st_mtime):
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    translations = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring translation cache {cache_file}: {e}")
+            translations = {}
+        
+        if not translations:
+            # Read raw bytes and locate the literal with C-level substring
+            # search; only the dict slice is decoded to text
+            content = lang_file.read_bytes()
+            
+            # Extract the TRANSLATIONS dictionary using a simple approach
+            if b'TRANSLATIONS' in content:
+                start = content.find(b'TRANSLATIONS = {') + len(b'TRANSLATIONS = ')
+                end = content.rfind(b'}') + 1
+                if start > 0 and end > 0:
+                    try:
+                        # Use a safe way to evaluate the dictionary
+                        import ast
+                        translations = ast.literal_eval(content[start:end].decode('utf-8'))
+                    except (SyntaxError, ValueError) as e:
+                        logger.error(f"Error parsing translations in {lang_file}: {e}")
+                        return {}
+            
+            # Refresh the cache so the next startup takes the fast path; a
+            # read-only install is not an error
+            if translations:
+                try:
+                    with open(cache_file, 'w', encoding='utf-8') as f:
+                        json.dump(translations, f, ensure_ascii=False)
+                except OSError:
+                    pass
+        
+        return translations
+    
     def load_language(self, lang_code):
         """
         Load translations for the specified language code.
@@ -137,11 +226,12 @@ class SimpleLanguageManager(QObject):
         Returns:
             bool: True if the language was loaded successfully, False otherwise
         """
-        if lang_code not in self.translations:
+        if not self._ensure_loaded(lang_code):
             logger.warning(f"Language not available: {lang_code}")
             return False
             
         self.current_language = lang_code
+        self._active = self.translations[lang_code]
         logger.info(f"Loaded language: {lang_code}")
         self.language_changed.emit()  # Emit signal when language changes
         return True
@@ -157,7 +247,7 @@ class SimpleLanguageManager(QObject):
         Returns:
             The translated text or the default value if not found
         """
-        return self.translations.get(key, default)
+        return self._active.get(key, default)
     
     def get_available_languages(self):
         """
@@ -190,7 +280,30 @@ class SimpleLanguageManager(QObject):
         Returns:
             str: The translated string or the default value if not found
         """
-        target_lang = lang_code if lang_code else self.current_language
-        if target_lang in self.translations and key in self.translations[target_lang]:
-            return self.translations[target_lang][key]
+        if lang_code and lang_code not in self.translations:
+            self._ensure_loaded(lang_code)
+        table = self.translations.get(lang_code, self._active) if lang_code else self._active
+        if key in table:
+            return table[key]
         return default if default is not None else key
+
+    def tr_many(self, keys, lang_code=None):
+        """
+        Get translated strings for several keys in one pass.
+
+        Fetches the language table once and resolves all keys against it,
+        instead of paying the per-call overhead of tr() for each key.
+        Missing keys fall back to the key itself, like tr() without a default.
+
+        Args:
+            keys: Iterable of translation keys
+            lang_code (str, optional): Language code to use for translation.
+                                     If not provided, uses the current language.
+
+        Returns:
+            dict: Mapping of each key to its translated string
+        """
+        if lang_code and lang_code not in self.translations:
+            self._ensure_loaded(lang_code)
+        table = self.translations.get(lang_code, self._active) if lang_code else self._active
+        return {key: table.get(key, key) for key in keys}
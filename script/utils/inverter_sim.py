@@ -8,18 +8,19 @@ fault conditions, and parameter adjustments.
 
 import random
 import time
-import logging
-import json
-import os
 import csv
+import queue
 from enum import Enum, auto
-from dataclasses import dataclass, asdict, field
-from typing import Dict, Optional, List, Tuple, Callable, Any
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Callable, Any
 import threading
 from pathlib import Path
-from dataclasses_json import dataclass_json
 from script.utils.logger import get_logger
 logger = get_logger(__name__)
+
+# Riferimento diretto al generatore: evita il lookup modulo+attributo a
+# ogni estrazione nel loop di simulazione
+_random = random.random
 logger.info("Inverter simulator initialized")
 
 class StatoInverter(Enum):
@@ -42,7 +43,6 @@ class CodiceAllarme(Enum):
     GUASTO_HARDWARE = 8
     COMUNICAZIONE = 9
 
-@dataclass_json
 @dataclass
 class Allarme:
     """Class representing an alarm/error condition in the inverter."""
@@ -60,6 +60,10 @@ class Allarme:
             'attivo': self.attivo
         }
 
+# Stati in cui l'inverter sta effettivamente pilotando il motore; frozenset
+# a livello di modulo così i test di appartenenza non riallocano una tupla
+_RUNNING_STATES = frozenset({StatoInverter.IN_MARCIA, StatoInverter.ACCELERAZIONE})
+
 class InverterSimulato:
     """
     Simulates a Nidec inverter with realistic behavior including:
@@ -93,7 +97,11 @@ class InverterSimulato:
         self.tensione_nominale = self.config['tensione_nominale']
         self.corrente_nominale = self.config['corrente_nominale']
         self.velocita_nominale = self.config['velocita_nominale']
-        
+
+        # Costanti derivate dalla configurazione, calcolate una volta sola
+        # invece di rifare lookup e moltiplicazioni a ogni tick
+        self._recompute_derived()
+
         # Parametri operativi
         self.frequenza_uscita = 0.0    # Hz
         self.tensione_uscita = self.tensione_nominale  # Set to nominal voltage to avoid low voltage alarm
@@ -109,13 +117,22 @@ class InverterSimulato:
         # State and control
         self.stato = StatoInverter.PRONTO
         self.direzione = 1              # 1 = avanti, -1 = indietro
+        # Direzione richiesta mentre il motore gira: applicata dal loop di
+        # aggiornamento una volta raggiunto lo stato PRONTO
+        self._pending_direction: Optional[int] = None
         self.comando_remoto = False
         self.rete_attiva = True
         self.in_marcia = False
         self.allarme_attivo = False
         self.descrizione_allarme = "Nessun allarme"
         self.allarmi: List[Allarme] = []
-        
+        # Indice degli allarmi attivi per codice: il controllo a ogni tick
+        # resta O(1) anche quando lo storico degli allarmi cresce
+        self._active_alarms: Dict[CodiceAllarme, Allarme] = {}
+        # Ultimo allarme attivato, mantenuto direttamente per evitare di
+        # rifiltrare lo storico a ogni notifica
+        self._last_active_alarm: Optional[Allarme] = None
+
         # Callbacks for state changes
         self._state_change_callbacks = []
         self._alarm_callbacks = []
@@ -129,10 +146,39 @@ class InverterSimulato:
         self._log_file = str(self._log_dir / "inverter_log.csv")
         self._log_interval = 1.0  # seconds
         self._last_log_time = 0
+
+        # File di log aperto una volta sola con un buffer ampio: ogni
+        # campione diventa una writerow nel buffer invece di un ciclo
+        # open/close per ogni riga
+        self._log_fields = ('timestamp', 'stato', 'frequenza', 'tensione',
+                            'corrente', 'velocita', 'temperatura',
+                            'allarme_attivo', 'descrizione_allarme')
+        self._log_fh = None
+        self._log_writer = None
+        try:
+            self._log_fh = open(self._log_file, 'a', newline='',
+                                buffering=1 << 16)
+            self._log_writer = csv.writer(self._log_fh)
+            if self._log_fh.tell() == 0:
+                self._log_writer.writerow(self._log_fields)
+        except OSError as e:
+            logger.error(f"Impossibile aprire il file di log {self._log_file}: {e}")
+            self._log_enabled = False
+
+        # Coda limitata verso il thread di scrittura: il loop di
+        # simulazione si limita a una put_nowait, così uno stallo del
+        # disco non blocca mai i tick
+        self._log_q: queue.Queue = queue.Queue(maxsize=2048)
+        self._log_dropped = 0
+        self._log_thread = None
+        if self._log_enabled:
+            self._log_thread = threading.Thread(
+                target=self._drain_log_queue, daemon=True)
+            self._log_thread.start()
         
         # Parametri di simulazione
         self._tempo_inizio = time.time()
-        self._ultimo_aggiornamento = time.time()
+        self._ultimo_aggiornamento = time.monotonic()
         self._frequenza_obiettivo = 0.0
         self._tensione_obiettivo = 0.0
         self._velocita_obiettivo = 0.0
@@ -145,6 +191,7 @@ class InverterSimulato:
         # Start update timer
         self._update_timer = None
         self._running = True
+        self._stop_event = threading.Event()
         self._start_update_timer()
         
         logger.info("Inverter simulator initialized")
@@ -152,18 +199,27 @@ class InverterSimulato:
     def _start_update_timer(self):
         """Start the periodic update timer"""
         def _periodic_update():
-            while self._running:
-                start_time = time.time()
+            # Schedulazione a scadenze assolute: il prossimo tick e'
+            # sempre +0.1 s dal precedente, quindi il ritardo di un tick
+            # non si accumula come deriva sul periodo
+            next_tick = time.monotonic() + 0.1
+            while not self._stop_event.is_set():
                 try:
                     self.update()
                     self._log_data()
                 except Exception as e:
                     logger.error(f"Error in update loop: {e}")
-                
-                # Sleep to maintain approximately 10Hz update rate
-                elapsed = time.time() - start_time
-                sleep_time = max(0.01, 0.1 - elapsed)  # Target 10Hz (0.1s)
-                time.sleep(sleep_time)
+
+                # Wait on the stop event: immune to wall-clock jumps and
+                # wakes immediately on close()
+                now = time.monotonic()
+                if now >= next_tick:
+                    # Tick in ritardo: riallinea senza tentare di recuperare
+                    # con una raffica di aggiornamenti
+                    next_tick = now + 0.1
+                else:
+                    self._stop_event.wait(next_tick - now)
+                    next_tick += 0.1
         
         self._update_timer = threading.Thread(target=_periodic_update, daemon=True)
         self._update_timer.start()
@@ -178,22 +234,45 @@ class InverterSimulato:
         self.potenza_uscita = 0.0
         self.temperatura = 25.0
         self.stato = StatoInverter.PRONTO
-        self.allarme_attivo = False
-        self.descrizione_allarme = "Nessun allarme"
-        self.allarmi.clear()
-        self._notify_state_change()
-        self.potenza_uscita = 0.0
-        self.temperatura = 25.0
-        self.stato = StatoInverter.PRONTO
         self.direzione = 1
+        self._pending_direction = None
         self.in_marcia = False
         self.allarme_attivo = False
         self.descrizione_allarme = "Nessun allarme"
         self.allarmi.clear()
+        self._active_alarms.clear()
+        self._last_active_alarm = None
         self._frequenza_obiettivo = 0.0
         self._tensione_obiettivo = 0.0
         self._velocita_obiettivo = 0.0
+        # Notifica solo a stato completamente ricostruito
+        self._notify_state_change()
     
+    def _recompute_derived(self):
+        """Ricalcola le costanti derivate dalla configurazione"""
+        self._ramp_acc = self.config['rampa_accelerazione']
+        self._ramp_dec = self.config['rampa_decelerazione']
+        self._vf_ratio = self.config['tensione_nominale'] / self.config['frequenza_nominale']
+        self._inv_fnom = 1.0 / self.config['frequenza_nominale']
+        self._i_trip = self.config['corrente_max'] * 1.1
+        self._v_under = self.config['tensione_min'] * 0.9
+        self._v_over = self.config['tensione_max'] * 1.1
+        self._t_max = self.config['temperatura_max']
+
+    def update_config(self, config: Dict[str, float]):
+        """
+        Aggiorna la configurazione e ricalcola le costanti derivate
+
+        Args:
+            config: Valori di configurazione da unire a quelli correnti
+        """
+        self.config.update(config)
+        self.frequenza_nominale = self.config['frequenza_nominale']
+        self.tensione_nominale = self.config['tensione_nominale']
+        self.corrente_nominale = self.config['corrente_nominale']
+        self.velocita_nominale = self.config['velocita_nominale']
+        self._recompute_derived()
+
     def ferma(self) -> bool:
         """
         Ferma l'inverter
@@ -201,7 +280,7 @@ class InverterSimulato:
         Returns:
             bool: True se l'arresto è stato avviato, False altrimenti
         """
-        if self.stato in (StatoInverter.IN_MARCIA, StatoInverter.ACCELERAZIONE):
+        if self.stato in _RUNNING_STATES:
             self.stato = StatoInverter.DECELERAZIONE
             self._notify_state_change()
             logger.info("Arresto inverter avviato")
@@ -244,6 +323,35 @@ class InverterSimulato:
                       frequenza, self.frequenza_nominale)
         return False
     
+    def cambia_direzione(self, direzione: int) -> bool:
+        """
+        Cambia la direzione di rotazione senza bloccare il chiamante
+        
+        Se il motore e' in marcia l'inverter decelera prima fino a fermo;
+        la nuova direzione viene applicata e la marcia ripresa dal loop di
+        aggiornamento al raggiungimento dello stato PRONTO.
+        
+        Args:
+            direzione: 1 = avanti, -1 = indietro
+            
+        Returns:
+            bool: True se la richiesta e' stata accettata, False altrimenti
+        """
+        if direzione not in (1, -1):
+            logger.warning("Direzione non valida: %s", direzione)
+            return False
+        if direzione == self.direzione:
+            self._pending_direction = None
+            return True
+        if self.stato in _RUNNING_STATES:
+            self._pending_direction = direzione
+            self.ferma()
+        else:
+            self.direzione = direzione
+        logger.info("Direzione impostata a %s", 
+                   "avanti" if direzione == 1 else "indietro")
+        return True
+    
     def update(self):
         """
         Aggiorna lo stato del simulatore
@@ -251,10 +359,19 @@ class InverterSimulato:
         Questo metodo dovrebbe essere chiamato periodicamente per aggiornare
         lo stato dell'inverter in base al tempo trascorso.
         """
-        now = time.time()
+        now = time.monotonic()
         dt = min(0.2, now - self._ultimo_aggiornamento)  # Limita dt per evitare salti eccessivi
         self._ultimo_aggiornamento = now
         
+        # Percorso rapido: inverter fermo a temperatura ambiente, nessun
+        # allarme e nessun obiettivo -- non c'e' dinamica da simulare
+        if (self.stato == StatoInverter.PRONTO
+                and not self.allarme_attivo
+                and self.frequenza_uscita == 0.0
+                and self._frequenza_obiettivo == 0.0
+                and self.temperatura <= 25.01):
+            return
+        
         try:
             # Aggiorna il tempo di attivazione
             if self.in_marcia:
@@ -273,7 +390,9 @@ class InverterSimulato:
             self._update_state()
             
         except Exception as e:
-            logger.error(f"Errore durante l'aggiornamento: {e}", exc_info=True)
+            # Niente exc_info qui: formattare il traceback a 10 Hz su un
+            # errore ripetuto costa più dell'aggiornamento stesso
+            logger.error(f"Errore durante l'aggiornamento: {e}")
             # In caso di errore, metti l'inverter in stato di allarme
             if not self.allarme_attivo:
                 self._add_alarm(CodiceAllarme.GUASTO_SOFTWARE, 
@@ -289,8 +408,7 @@ class InverterSimulato:
         # Aggiorna la frequenza in base allo stato
         if self.stato == StatoInverter.ACCELERAZIONE:
             # Accelerazione con rampa
-            ramp_rate = self.config['rampa_accelerazione']  # Hz/s
-            freq_step = ramp_rate * dt
+            freq_step = self._ramp_acc * dt  # Hz/s
             
             if self.frequenza_uscita < self._frequenza_obiettivo:
                 self.frequenza_uscita = min(self._frequenza_obiettivo, 
@@ -301,8 +419,7 @@ class InverterSimulato:
                 
         elif self.stato == StatoInverter.DECELERAZIONE:
             # Decelerazione con rampa
-            ramp_rate = self.config['rampa_decelerazione']  # Hz/s
-            freq_step = ramp_rate * dt
+            freq_step = self._ramp_dec * dt  # Hz/s
             
             if self.frequenza_uscita > 0.1:  # Soglia minima
                 self.frequenza_uscita = max(0, self.frequenza_uscita - freq_step)
@@ -314,66 +431,67 @@ class InverterSimulato:
         
         # Calcola la tensione in base alla frequenza (V/f costante)
         if self.frequenza_uscita > 0:
-            v_f_ratio = self.tensione_nominale / self.frequenza_nominale
-            self.tensione_uscita = self.frequenza_uscita * v_f_ratio
+            self.tensione_uscita = self.frequenza_uscita * self._vf_ratio
         else:
             # Mantieni la tensione nominale anche a frequenza 0 per evitare allarmi di bassa tensione
             self.tensione_uscita = self.tensione_nominale
         
         # Calcola la corrente in base al carico
         # Per semplicità, assumiamo un carico quadratico
-        load_factor = (self.frequenza_uscita / self.frequenza_nominale) ** 2
-        self.corrente_uscita = load_factor * self.corrente_nominale * (0.9 + 0.2 * random.random())
+        load_factor = (self.frequenza_uscita * self._inv_fnom) ** 2
+        self.corrente_uscita = load_factor * self.corrente_nominale * (0.9 + 0.2 * _random())
         
         # Calcola la velocità del motore
         slip = 0.02  # 2% di scorrimento a pieno carico
         sync_speed = (120 * self.frequenza_uscita) / 2  # Per un motore a 2 poli
         self.velocita_motore = sync_speed * (1 - slip * load_factor)
         
-        # Calcola la coppia (semplificato)
-        self.coppia = (self.potenza_uscita * 9.549) / (self.velocita_motore + 0.001)  # Evita divisione per zero
-        
         # Calcola la potenza in uscita
-        self.potenza_uscita = (self.tensione_uscita * self.corrente_uscita * 
-                              self.fattore_potenza / 1000.0)  # kWecondi)
+        self.potenza_uscita = (self.tensione_uscita * self.corrente_uscita *
+                              self.fattore_potenza / 1000.0)  # kW
+
+        # Calcola la coppia (semplificato) dalla potenza appena calcolata
+        self.coppia = self.potenza_uscita * (9.549 / (self.velocita_motore + 0.001))  # Evita divisione per zero
     
     def _check_alarms(self):
         """Controlla le condizioni di allarme"""
-        # Resetta lo stato di allarme precedente
         prev_alarm = self.allarme_attivo
-        self.allarme_attivo = False
-        self.descrizione_allarme = "Nessun allarme"
         
         # Controlla i vari tipi di allarme
         alarms = []
         
         # Sovracorrente
-        if self.corrente_uscita > self.config['corrente_max'] * 1.1:
+        if self.corrente_uscita > self._i_trip:
             alarms.append((CodiceAllarme.SOVRACORRENTE, 
                          f"Sovracorrente: {self.corrente_uscita:.1f}A > {self.config['corrente_max']}A"))
         
         # Sottotensione
-        if self.tensione_uscita < self.config['tensione_min'] * 0.9:
+        if self.tensione_uscita < self._v_under:
             alarms.append((CodiceAllarme.SOTTOTENSIONE,
                          f"Sottotensione: {self.tensione_uscita:.1f}V < {self.config['tensione_min']}V"))
         
         # Sovratensione
-        if self.tensione_uscita > self.config['tensione_max'] * 1.1:
+        if self.tensione_uscita > self._v_over:
             alarms.append((CodiceAllarme.SOVRATENSIONE,
                          f"Sovratensione: {self.tensione_uscita:.1f}V > {self.config['tensione_max']}V"))
         
         # Sovratemperatura
-        if self.temperatura > self.config['temperatura_max']:
+        if self.temperatura > self._t_max:
             alarms.append((CodiceAllarme.SOVRATEMPERATURA,
                          f"Sovratemperatura: {self.temperatura:.1f}°C > {self.config['temperatura_max']}°C"))
         
         # Gestisci gli allarmi rilevati
         for code, desc in alarms:
-            if not any(a.codice == code and a.attivo for a in self.allarmi):
+            if code not in self._active_alarms:
                 self._add_alarm(code, desc)
-        
-        # Aggiorna lo stato di allarme
-        self.allarme_attivo = any(a.attivo for a in self.allarmi)
+
+        # Aggiorna lo stato di allarme; la descrizione segue l'ultimo
+        # allarme attivo invece di essere azzerata e ricostruita a ogni tick
+        self.allarme_attivo = bool(self._active_alarms)
+        if not self.allarme_attivo:
+            self.descrizione_allarme = "Nessun allarme"
+        elif self._last_active_alarm is not None:
+            self.descrizione_allarme = self._last_active_alarm.descrizione
         
         # Se c'è un allarme attivo, ferma l'inverter
         if self.allarme_attivo and not prev_alarm:
@@ -403,6 +521,13 @@ class InverterSimulato:
         if self.stato != prev_state:
             logger.info("Stato inverter cambiato da %s a %s", prev_state, self.stato)
             self._notify_state_change()
+        
+        # Inversione differita: a motore fermo applica la nuova direzione
+        # e riprendi la marcia
+        if self._pending_direction is not None and self.stato == StatoInverter.PRONTO:
+            self.direzione = self._pending_direction
+            self._pending_direction = None
+            self.avvia()
     
     def _add_alarm(self, code: CodiceAllarme, description: str):
         """
@@ -428,8 +553,10 @@ class InverterSimulato:
                 attivo=True
             )
             self.allarmi.append(alarm)
-        
+
         # Aggiorna lo stato di allarme
+        self._active_alarms[code] = alarm
+        self._last_active_alarm = alarm
         self.allarme_attivo = True
         self.descrizione_allarme = description
         logger.warning("Allarme: %s", description)
@@ -449,7 +576,9 @@ class InverterSimulato:
             
         for allarme in self.allarmi:
             allarme.attivo = False
-            
+
+        self._active_alarms.clear()
+        self._last_active_alarm = None
         self.allarme_attivo = False
         self.descrizione_allarme = "Nessun allarme"
         
@@ -463,16 +592,16 @@ class InverterSimulato:
     def _simulate_random_variations(self):
         """Aggiunge variazioni casuali ai parametri per simulare il comportamento reale"""
         # Variazione casuale della temperatura
-        temp_change = (random.random() - 0.5) * 0.1  # +/- 0.05°C
+        temp_change = (_random() - 0.5) * 0.1  # +/- 0.05°C
         if self.in_marcia:
             # Aumenta la temperatura quando l'inverter è in funzione
-            temp_change += 0.01 * self.frequenza_uscita / self.frequenza_nominale
+            temp_change += 0.01 * self.frequenza_uscita * self._inv_fnom
         self.temperatura = max(20.0, min(90.0, self.temperatura + temp_change))
         
         # Piccole variazioni casuali di tensione e corrente
         if self.tensione_uscita > 0:
-            self.tensione_uscita *= (0.995 + 0.01 * random.random())
-            self.corrente_uscita *= (0.98 + 0.04 * random.random())
+            self.tensione_uscita *= (0.995 + 0.01 * _random())
+            self.corrente_uscita *= (0.98 + 0.04 * _random())
     
     def _log_data(self):
         """Logga i dati correnti dell'inverter"""
@@ -483,44 +612,110 @@ class InverterSimulato:
         if now - self._last_log_time >= self._log_interval:
             self._last_log_time = now
             
-            log_entry = {
-                'timestamp': now,
-                'stato': self.stato.name,
-                'frequenza': self.frequenza_uscita,
-                'tensione': self.tensione_uscita,
-                'corrente': self.corrente_uscita,
-                'velocita': self.velocita_motore,
-                'temperatura': self.temperatura,
-                'allarme_attivo': self.allarme_attivo,
-                'descrizione_allarme': self.descrizione_allarme
-            }
-            
+            # Riga in ordine fisso (_log_fields); niente DictWriter e
+            # niente controllo di esistenza del file per ogni campione
+            row = (
+                now,
+                self.stato.name,
+                self.frequenza_uscita,
+                self.tensione_uscita,
+                self.corrente_uscita,
+                self.velocita_motore,
+                self.temperatura,
+                self.allarme_attivo,
+                self.descrizione_allarme,
+            )
+
             try:
-                file_exists = os.path.exists(self._log_file)
-                with open(self._log_file, 'a', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=log_entry.keys())
-                    if not file_exists:
-                        writer.writeheader()
-                    writer.writerow(log_entry)
+                self._log_q.put_nowait(row)
+            except queue.Full:
+                # Meglio perdere un campione che bloccare la simulazione
+                self._log_dropped += 1
+                if self._log_dropped % 100 == 1:
+                    logger.warning("Coda di log piena: %d campioni scartati",
+                                   self._log_dropped)
+
+    def _drain_log_queue(self):
+        """Scrive su disco le righe accodate da _log_data (thread dedicato)"""
+        stop = False
+        while not stop:
+            row = self._log_q.get()
+            if row is None:  # Sentinella di arresto
+                break
+            # Raccoglie quanto già accodato (fino a 64 righe) così un solo
+            # writerows + flush copre l'intero lotto invece di una coppia
+            # serializzazione/syscall per riga
+            rows = [row]
+            while len(rows) < 64:
+                try:
+                    nxt = self._log_q.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                rows.append(nxt)
+            try:
+                self._log_writer.writerows(rows)
+                self._log_fh.flush()
             except Exception as e:
                 logger.error(f"Errore durante il salvataggio del log: {e}")
     
+    def close(self):
+        """Ferma il simulatore e chiude il file di log"""
+        self._running = False
+        self._stop_event.set()
+        if self._update_timer is not None:
+            self._update_timer.join(timeout=1.0)
+            self._update_timer = None
+        if self._log_thread is not None:
+            try:
+                self._log_q.put_nowait(None)
+            except queue.Full:
+                pass
+            self._log_thread.join(timeout=2.0)
+            self._log_thread = None
+        if self._log_fh is not None:
+            try:
+                self._log_fh.flush()
+                self._log_fh.close()
+            except OSError as e:
+                logger.error(f"Errore durante la chiusura del log: {e}")
+            self._log_fh = None
+            self._log_writer = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _notify_state_change(self):
         """Notifica i listener del cambiamento di stato"""
+        # Un callback che solleva viene rimosso: un listener rotto non deve
+        # costare un log formattato a ogni notifica del loop a 10 Hz
+        bad = None
         for callback in self._state_change_callbacks:
             try:
                 callback(self.stato)
             except Exception as e:
-                logger.error(f"Errore nel callback di stato: {e}")
-    
+                logger.error(f"Errore nel callback di stato, listener rimosso: {e}")
+                bad = callback if bad is None else bad
+        if bad is not None:
+            self._state_change_callbacks.remove(bad)
+
     def _notify_alarm(self):
         """Notifica i listener di un nuovo allarme"""
-        active_alarms = [a for a in self.allarmi if a.attivo]
+        last_alarm = self._last_active_alarm
+        bad = None
         for callback in self._alarm_callbacks:
             try:
-                callback(active_alarms[-1] if active_alarms else None)
+                callback(last_alarm)
             except Exception as e:
-                logger.error(f"Errore nel callback di allarme: {e}")
+                logger.error(f"Errore nel callback di allarme, listener rimosso: {e}")
+                bad = callback if bad is None else bad
+        if bad is not None:
+            self._alarm_callbacks.remove(bad)
     
     def add_state_change_callback(self, callback: Callable[[StatoInverter], None]):
         """
@@ -544,50 +739,60 @@ class InverterSimulato:
         if callback not in self._alarm_callbacks:
             self._alarm_callbacks.append(callback)
     
+    def _fault_overcurrent(self, description: Optional[str]) -> bool:
+        self.corrente_uscita = self.config['corrente_max'] * 1.5  # 150% of max current
+        self._add_alarm(CodiceAllarme.SOVRACORRENTE, description or "Overcurrent fault injected")
+        return True
+
+    def _fault_overtemp(self, description: Optional[str]) -> bool:
+        self.temperatura = self.config['temperatura_max'] + 10.0  # 10°C above max
+        self._add_alarm(CodiceAllarme.SOVRATEMPERATURA, description or "Overtemperature fault injected")
+        return True
+
+    def _fault_undervoltage(self, description: Optional[str]) -> bool:
+        self.tensione_uscita = self.config['tensione_min'] * 0.8  # 20% below min
+        self._add_alarm(CodiceAllarme.SOTTOTENSIONE, description or "Undervoltage fault injected")
+        return True
+
+    def _fault_overvoltage(self, description: Optional[str]) -> bool:
+        self.tensione_uscita = self.config['tensione_max'] * 1.2  # 20% above max
+        self._add_alarm(CodiceAllarme.SOVRATENSIONE, description or "Overvoltage fault injected")
+        return True
+
+    def _fault_communication(self, description: Optional[str]) -> bool:
+        self._add_alarm(CodiceAllarme.COMUNICAZIONE, description or "Communication fault injected")
+        return True
+
+    def _fault_reset(self, description: Optional[str]) -> bool:
+        # Reset all faults
+        self.reset_allarmi()
+        self.tensione_uscita = self.config['tensione_nominale']
+        self.corrente_uscita = 0.0
+        self.temperatura = 25.0
+        return True
+
+    # Tabella di dispatch: tipo di guasto (minuscolo) -> handler
+    _FAULT_TABLE: Dict[str, Callable] = {
+        'overcurrent': _fault_overcurrent,
+        'overtemp': _fault_overtemp,
+        'undervoltage': _fault_undervoltage,
+        'overvoltage': _fault_overvoltage,
+        'communication': _fault_communication,
+        'reset': _fault_reset,
+    }
+
     def inject_fault(self, fault_type: str, description: str = None):
         """
         Inietta un guasto simulato nell'inverter.
-        
+
         Args:
             fault_type: Tipo di guasto da iniettare (es. 'overcurrent', 'overtemp', 'undervoltage', 'overvoltage', 'communication')
             description: Descrizione opzionale del guasto
-            
+
         Returns:
             bool: True se il guasto è stato iniettato con successo, False altrimenti
         """
-        fault_type = fault_type.lower()
-        
-        if fault_type == 'overcurrent':
-            self.corrente_uscita = self.config['corrente_max'] * 1.5  # 150% of max current
-            self._add_alarm(CodiceAllarme.SOVRACORRENTE, description or "Overcurrent fault injected")
-            return True
-            
-        elif fault_type == 'overtemp':
-            self.temperatura = self.config['temperatura_max'] + 10.0  # 10°C above max
-            self._add_alarm(CodiceAllarme.SOVRATEMPERATURA, description or "Overtemperature fault injected")
-            return True
-            
-        elif fault_type == 'undervoltage':
-            self.tensione_uscita = self.config['tensione_min'] * 0.8  # 20% below min
-            self._add_alarm(CodiceAllarme.SOTTOTENSIONE, description or "Undervoltage fault injected")
-            return True
-            
-        elif fault_type == 'overvoltage':
-            self.tensione_uscita = self.config['tensione_max'] * 1.2  # 20% above max
-            self._add_alarm(CodiceAllarme.SOVRATENSIONE, description or "Overvoltage fault injected")
-            return True
-            
-        elif fault_type == 'communication':
-            self._add_alarm(CodiceAllarme.COMUNICAZIONE, description or "Communication fault injected")
-            return True
-            
-        elif fault_type == 'reset':
-            # Reset all faults
-            self.reset_allarmi()
-            self.tensione_uscita = self.config['tensione_nominale']
-            self.corrente_uscita = 0.0
-            self.temperatura = 25.0
-            return True
-            
-        return False
-        return True
+        handler = self._FAULT_TABLE.get(fault_type.lower())
+        if handler is None:
+            return False
+        return handler(self, description)
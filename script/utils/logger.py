@@ -8,8 +8,10 @@ This module provides a centralized logging system that:
 """
 
 import os
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -17,10 +19,21 @@ from pathlib import Path
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True, parents=True)
 
+# All loggers share one queue: emitting a record is a cheap enqueue, and a
+# single background listener owns the rotating file handler, so logging
+# threads never block on file I/O or contend on the handler lock
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_listener: QueueListener = None
+
 # Default log format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Shared formatter and daily log path, computed once per process instead of
+# per setup_logger call (the rotating handler renames at midnight anyway)
+_FORMATTER = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+_LOG_FILE = LOG_DIR / f"nidec_commander_{datetime.now().strftime('%Y%m%d')}.log"
+
 # Log levels mapping
 LOG_LEVELS = {
     'DEBUG': logging.DEBUG,
@@ -30,6 +43,29 @@ LOG_LEVELS = {
     'CRITICAL': logging.CRITICAL
 }
 
+def _ensure_listener() -> None:
+    """Start the shared queue listener with the file handler on first use."""
+    global _listener
+    if _listener is not None:
+        return
+
+    # Create file handler that creates new file every day and keeps logs for 30 days
+    file_handler = TimedRotatingFileHandler(
+        _LOG_FILE,
+        when='midnight',
+        interval=1,
+        backupCount=30,  # Keep logs for 30 days
+        encoding='utf-8',
+        delay=False
+    )
+    file_handler.setFormatter(_FORMATTER)
+    file_handler.suffix = "%Y%m%d.log"
+
+    _listener = QueueListener(_LOG_QUEUE, file_handler,
+                              respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
 def setup_logger(name: str, log_level: str = 'INFO', log_to_console: bool = True) -> logging.Logger:
     """
     Configure and return a logger with file and optional console handlers.
@@ -50,32 +86,16 @@ def setup_logger(name: str, log_level: str = 'INFO', log_to_console: bool = True
     if logger.handlers:
         return logger
     
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    
-    # Create logs directory if it doesn't exist
-    LOG_DIR.mkdir(exist_ok=True, parents=True)
-    
-    # Create file handler that creates new file every day and keeps logs for 30 days
-    log_file = LOG_DIR / f"nidec_commander_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = TimedRotatingFileHandler(
-        log_file,
-        when='midnight',
-        interval=1,
-        backupCount=30,  # Keep logs for 30 days
-        encoding='utf-8',
-        delay=False
-    )
-    file_handler.setFormatter(formatter)
-    file_handler.suffix = "%Y%m%d.log"
-    
-    # Add file handler to logger
-    logger.addHandler(file_handler)
+    # File output goes through the shared queue; the listener thread owns
+    # the actual TimedRotatingFileHandler. The logs directory is created
+    # once at import time.
+    _ensure_listener()
+    logger.addHandler(QueueHandler(_LOG_QUEUE))
     
     # Add console handler if requested
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         logger.addHandler(console_handler)
     
     return logger
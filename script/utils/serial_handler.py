@@ -12,12 +12,30 @@ from script.utils.logger import get_logger
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Risposte fisse, codificate una volta a livello di modulo: i percorsi
+# comuni OK/ERR scrivono questi bytes senza alcun encode per messaggio
+_OK = b"OK\r\n"
+_ERR_UNKNOWN = b"ERR: Comando non riconosciuto\r\n"
+_ERR_START = b"ERR: Impossibile avviare l'inverter\r\n"
+_ERR_STOP = b"ERR: Impossibile fermare l'inverter\r\n"
+_ERR_FREQ_FMT = b"ERR: Formato non valido. Usa: FREQ <valore>\r\n"
+_ERR_DIR_FMT = b"ERR: Formato non valido. Usa: DIR 1 (avanti) o DIR -1 (indietro)\r\n"
+_ERR_VALUE = b"ERR: Valore non valido\r\n"
+
 @dataclass
 class ComandoSeriale:
     comando: str
     risposta: str
     descrizione: str
-    handler: Optional[Callable[[str], str]] = None
+    handler: Optional[Callable[[str], bytes]] = None
+    # Pattern compilato per i comandi con argomento (FREQ, DIR); None per
+    # i comandi a confronto diretto di stringa
+    compiled: Optional[re.Pattern] = None
+    # Forma gia' codificata della risposta fissa
+    risposta_b: bytes = b""
+    
+    def __post_init__(self):
+        self.risposta_b = self.risposta.encode('ascii')
 
 class SerialHandler:
     @property
@@ -33,6 +51,9 @@ class SerialHandler:
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self._connected = False  # Tracks connection state
+        # Match prodotto dal dispatcher per il comando in corso, cosi' i
+        # gestori non rieseguono la stessa regex sul medesimo testo
+        self._last_match: Optional[re.Match] = None
         
         # Mappa dei comandi supportati (comando: risposta o handler)
         self.comandi: Dict[str, ComandoSeriale] = {
@@ -55,13 +76,13 @@ class SerialHandler:
                 self._handle_reset
             ),
             "FREQ": ComandoSeriale(
-                r"FREQ (\d+\.?\d*)", 
+                r"FREQ\s+(\d+(?:\.\d+)?)", 
                 "OK\r\n", 
                 "Imposta la frequenza (es: FREQ 50.0)",
                 self._handle_freq
             ),
             "DIR": ComandoSeriale(
-                r"DIR ([+-]?1)", 
+                r"DIR\s+([+-]?1)", 
                 "OK\r\n", 
                 "Imposta la direzione (1=avanti, -1=indietro)",
                 self._handle_dir
@@ -80,6 +101,37 @@ class SerialHandler:
             )
         }
         
+        # Precompila una volta sola i pattern dei comandi con argomento:
+        # _process_command esegue un fullmatch sull'oggetto compilato
+        # invece di ripassare la stringa a re a ogni messaggio
+        for cmd in self.comandi.values():
+            if re.escape(cmd.comando) != cmd.comando:
+                cmd.compiled = re.compile(cmd.comando, re.IGNORECASE)
+        
+        # Dispatch O(1) per i comandi letterali (chiavi gia' maiuscole);
+        # i pochi comandi con argomento restano in una lista provata solo
+        # quando il lookup diretto fallisce
+        self._literal = {k.upper(): c for k, c in self.comandi.items()
+                         if c.compiled is None}
+        self._regex_commands = [c for c in self.comandi.values()
+                                if c.compiled is not None]
+        
+        # Testo HELP: e' costante per tutta la vita dell'handler, quindi
+        # viene costruito e codificato una volta sola qui
+        self._help_bytes = (
+            "\r\n=== COMANDI DISPONIBILI ===\r\n"
+            + "".join(f"{name}: {c.descrizione}\r\n"
+                      for name, c in self.comandi.items() if c.compiled is None)
+            + "\r\nEsempi:\r\n"
+              "  RUN       - Avvia l'inverter\r\n"
+              "  STOP      - Ferma l'inverter\r\n"
+              "  FREQ 50.0 - Imposta la frequenza a 50.0 Hz\r\n"
+              "  DIR 1     - Imposta la direzione in avanti\r\n"
+              "  STATUS    - Mostra lo stato corrente\r\n"
+              "  HELP      - Mostra questo aiuto\r\n"
+              "=========================\r\n"
+        ).encode('ascii')
+        
         # Se non è specificata una porta, cerca una porta COM disponibile
         if not self.port:
             self._trova_porta_com()
@@ -105,7 +157,10 @@ class SerialHandler:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1.0,
+                # Timeout breve: read(1) in _read_serial blocca al massimo
+                # per questo intervallo, cosi' il thread resta reattivo a
+                # disconnect() senza dover fare polling
+                timeout=0.1,
                 write_timeout=1.0
             )
             self.running = True
@@ -115,7 +170,7 @@ class SerialHandler:
             self.thread.start()
             return True
         except Exception as e:
-            print(f"Error connecting to {self.port}: {e}")
+            logger.error("Error connecting to %s: %s", self.port, e)
             self._connected = False
             self.disconnect()
             return False
@@ -129,6 +184,7 @@ class SerialHandler:
         if self.serial_port:
             try:
                 if self.serial_port.is_open:
+                    self.serial_port.flush()
                     self.serial_port.close()
             except:
                 pass
@@ -146,149 +202,146 @@ class SerialHandler:
     
     def _read_serial(self):
         """Legge i dati dalla porta seriale e li elabora"""
-        buffer = ""
+        # Buffer a byte: append ammortizzato O(1) e ricerca del
+        # terminatore a livello di byte; si decodifica solo il comando
+        # completo, non ogni frammento ricevuto
+        buffer = bytearray()
         
         while self.running and self.serial_port and self.serial_port.is_open:
             try:
-                # Leggi i dati disponibili
-                if self.serial_port.in_waiting > 0:
-                    data = self.serial_port.read(self.serial_port.in_waiting).decode('ascii', errors='ignore')
-                    buffer += data
-                    
-                    # Elabora i comandi completi (terminati da \r\n)
-                    while '\r\n' in buffer:
-                        command, buffer = buffer.split('\r\n', 1)
-                        command = command.strip()
-                        
-                        if command:  # Ignora righe vuote
-                            self._process_command(command)
+                # Lettura bloccante del primo byte (limitata dal timeout
+                # della porta), poi drenaggio in una sola read di quanto
+                # gia' arrivato: due syscall per messaggio invece di un
+                # poll di in_waiting ogni 100 ms
+                data = self.serial_port.read(1)
+                if not data:
+                    continue
+                waiting = self.serial_port.in_waiting
+                if waiting:
+                    data += self.serial_port.read(waiting)
+                buffer.extend(data)
                 
-                # Aggiorna periodicamente lo stato
-                time.sleep(0.1)
+                # Elabora i comandi completi (terminati da \r\n)
+                while True:
+                    idx = buffer.find(b'\r\n')
+                    if idx < 0:
+                        break
+                    command = bytes(buffer[:idx]).decode('ascii', errors='ignore').strip()
+                    del buffer[:idx + 2]
+                    
+                    if command:  # Ignora righe vuote
+                        self._process_command(command)
                 
             except Exception as e:
-                print(f"Errore nella lettura seriale: {e}")
+                logger.error("Errore nella lettura seriale: %s", e)
                 time.sleep(1)  # Evita loop di errore
     
     def _process_command(self, command: str):
         """Elabora un comando ricevuto"""
-        print(f"Comando ricevuto: {command}")
+        logger.debug("Comando ricevuto: %s", command)
         
-        # Cerca un comando corrispondente
-        for cmd, handler in self.comandi.items():
-            # Se il comando è una regex, prova a fare il match
-            if hasattr(handler, 'pattern'):
-                match = re.fullmatch(handler.pattern, command, re.IGNORECASE)
+        # Comandi letterali: lookup diretto
+        handler = self._literal.get(command.upper())
+        if handler is None:
+            # Comandi con argomento: prova le poche regex compilate
+            for candidate in self._regex_commands:
+                match = candidate.compiled.fullmatch(command)
                 if match:
-                    if handler.handler:
-                        response = handler.handler(command)
-                        self._send_response(response)
-                    else:
-                        self._send_response(handler.risposta)
-                    return
-            # Altrimenti confronta direttamente le stringhe
-            elif command.upper() == cmd.upper():
-                if handler.handler:
-                    response = handler.handler(command)
-                    self._send_response(response)
-                else:
-                    self._send_response(handler.risposta)
-                return
+                    self._last_match = match
+                    handler = candidate
+                    break
+        
+        if handler is not None:
+            if handler.handler:
+                response = handler.handler(command)
+                self._send_response(response)
+            else:
+                self._send_response(handler.risposta_b)
+            return
         
         # Se nessun comando corrisponde, rispondi con errore
-        self._send_response("ERR: Comando non riconosciuto\r\n")
+        self._send_response(_ERR_UNKNOWN)
     
-    def _send_response(self, response: str):
-        """Invia una risposta sulla porta seriale"""
+    def _send_response(self, response):
+        """Invia una risposta (str o bytes) sulla porta seriale"""
         if self.serial_port and self.serial_port.is_open:
             try:
-                self.serial_port.write(response.encode('ascii'))
-                self.serial_port.flush()
+                if isinstance(response, str):
+                    # 'replace' perche' lo stato contiene caratteri non
+                    # ASCII (es. il grado in temperatura)
+                    response = response.encode('ascii', errors='replace')
+                # Niente flush() qui: bloccherebbe il thread di lettura
+                # finche' il kernel non svuota il buffer; il flush finale
+                # avviene in disconnect() prima della chiusura
+                self.serial_port.write(response)
             except Exception as e:
-                print(f"Errore nell'invio della risposta: {e}")
+                logger.error("Errore nell'invio della risposta: %s", e)
     
     # ===== Gestori dei comandi =====
     
-    def _handle_run(self, command: str) -> str:
+    def _handle_run(self, command: str) -> bytes:
         """Gestisce il comando RUN"""
         if self.inverter.avvia():
-            return "OK\r\n"
+            return _OK
         else:
-            return "ERR: Impossibile avviare l'inverter\r\n"
+            return _ERR_START
     
-    def _handle_stop(self, command: str) -> str:
+    def _handle_stop(self, command: str) -> bytes:
         """Gestisce il comando STOP"""
         if self.inverter.ferma():
-            return "OK\r\n"
+            return _OK
         else:
-            return "ERR: Impossibile fermare l'inverter\r\n"
+            return _ERR_STOP
     
-    def _handle_reset(self, command: str) -> str:
+    def _handle_reset(self, command: str) -> bytes:
         """Gestisce il comando RST (reset allarmi)"""
         self.inverter.reset_allarmi()
-        return "OK\r\n"
+        return _OK
     
-    def _handle_freq(self, command: str) -> str:
+    def _handle_freq(self, command: str) -> bytes:
         """Gestisce il comando FREQ <valore>"""
         try:
             # Estrai il valore numerico dal comando
-            match = re.match(r"FREQ\s+(\d+(?:\.\d+)?)", command, re.IGNORECASE)
+            match = self._last_match
             if match:
                 freq = float(match.group(1))
                 self.inverter.imposta_frequenza(freq)
-                return f"OK: Frequenza impostata a {freq} Hz\r\n"
+                return f"OK: Frequenza impostata a {freq} Hz\r\n".encode('ascii')
             else:
-                return "ERR: Formato non valido. Usa: FREQ <valore>\r\n"
+                return _ERR_FREQ_FMT
         except ValueError:
-            return "ERR: Valore non valido\r\n"
+            return _ERR_VALUE
     
-    def _handle_dir(self, command: str) -> str:
+    def _handle_dir(self, command: str) -> bytes:
         """Gestisce il comando DIR <1|-1>"""
         try:
-            match = re.match(r"DIR\s+([+-]?1)", command, re.IGNORECASE)
+            match = self._last_match
             if match:
                 direzione = int(match.group(1))
                 self.inverter.cambia_direzione(direzione)
                 dir_str = "avanti" if direzione == 1 else "indietro"
-                return f"OK: Direzione impostata a {dir_str}\r\n"
+                return f"OK: Direzione impostata a {dir_str}\r\n".encode('ascii')
             else:
-                return "ERR: Formato non valido. Usa: DIR 1 (avanti) o DIR -1 (indietro)\r\n"
+                return _ERR_DIR_FMT
         except ValueError:
-            return "ERR: Valore non valido\r\n"
+            return _ERR_VALUE
     
     def _handle_status(self, command: str) -> str:
         """Gestisce il comando STATUS"""
-        stato = {
-            "stato": self.inverter.stato.name,
-            "frequenza": f"{self.inverter.frequenza_uscita:.1f} Hz",
-            "tensione": f"{self.inverter.tensione_uscita:.1f} V",
-            "corrente": f"{self.inverter.corrente_uscita:.2f} A",
-            "velocita": f"{int(self.inverter.velocita_motore)} RPM",
-            "temperatura": f"{self.inverter.temperatura:.1f} °C",
-            "direzione": "AVANTI" if self.inverter.direzione == 1 else "INDIETRO",
-            "allarme": self.inverter.descrizione_allarme if self.inverter.allarme_attivo else "Nessuno"
-        }
-        
-        # Costruisci la risposta formattata
-        response = "\r\n=== STATO INVERTER ===\r\n"
-        for key, value in stato.items():
-            response += f"{key.upper()}: {value}\r\n"
-        response += "===================\r\n"
-        
-        return response
+        inv = self.inverter
+        return (
+            "\r\n=== STATO INVERTER ===\r\n"
+            f"STATO: {inv.stato.name}\r\n"
+            f"FREQUENZA: {inv.frequenza_uscita:.1f} Hz\r\n"
+            f"TENSIONE: {inv.tensione_uscita:.1f} V\r\n"
+            f"CORRENTE: {inv.corrente_uscita:.2f} A\r\n"
+            f"VELOCITA: {int(inv.velocita_motore)} RPM\r\n"
+            f"TEMPERATURA: {inv.temperatura:.1f} °C\r\n"
+            f"DIREZIONE: {'AVANTI' if inv.direzione == 1 else 'INDIETRO'}\r\n"
+            f"ALLARME: {inv.descrizione_allarme if inv.allarme_attivo else 'Nessuno'}\r\n"
+            "===================\r\n"
+        )
     
-    def _handle_help(self, command: str) -> str:
+    def _handle_help(self, command: str) -> bytes:
         """Gestisce il comando HELP"""
-        help_text = "\r\n=== COMANDI DISPONIBILI ===\r\n"
-        for cmd, handler in self.comandi.items():
-            if not hasattr(handler, 'pattern'):  # Mostra solo i comandi base, non le regex
-                help_text += f"{cmd}: {handler.descrizione}\r\n"
-        help_text += "\r\nEsempi:\r\n"
-        help_text += "  RUN       - Avvia l'inverter\r\n"
-        help_text += "  STOP      - Ferma l'inverter\r\n"
-        help_text += "  FREQ 50.0 - Imposta la frequenza a 50.0 Hz\r\n"
-        help_text += "  DIR 1     - Imposta la direzione in avanti\r\n"
-        help_text += "  STATUS    - Mostra lo stato corrente\r\n"
-        help_text += "  HELP      - Mostra questo aiuto\r\n"
-        help_text += "=========================\r\n"
-        return help_text
+        return self._help_bytes
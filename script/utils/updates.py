@@ -6,19 +6,42 @@ This module handles checking for and applying updates to the application.
 
 import sys
 import json
-import urllib.request
+import functools
 import platform
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Optional, Tuple, Any, Callable
 from datetime import datetime, timedelta
 
+import requests
+
 # Import language manager for translations
 from script.lang.lang_manager import SimpleLanguageManager
+from script.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Shared session: keeps the TLS connection to the GitHub API alive across
+# checks and negotiates gzip, so repeat polls skip the handshake and pull
+# a fraction of the bytes
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'Accept': 'application/vnd.github+json',
+    'User-Agent': 'Nidec-CommanderCDE-updater',
+})
+
+# Language manager, constructed lazily so importing the updater costs no
+# language-directory scan
+_language_manager: Optional[SimpleLanguageManager] = None
 
-# Initialize language manager
-language_manager = SimpleLanguageManager()
+def _get_language_manager() -> SimpleLanguageManager:
+    """Return the shared language manager, creating it on first use."""
+    global _language_manager
+    if _language_manager is None:
+        _language_manager = SimpleLanguageManager()
+    return _language_manager
 
 def t(key: str, language: str = 'en', default: Optional[str] = None) -> str:
     """Translation helper function for backward compatibility.
@@ -31,7 +54,23 @@ def t(key: str, language: str = 'en', default: Optional[str] = None) -> str:
     Returns:
         str: Translated string or default value
     """
-    return language_manager.tr(key, default=default or key, lang_code=language)
+    return _get_language_manager().tr(key, default=default or key, lang_code=language)
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version: Optional[str]) -> Tuple[int, ...]:
+    """Split a version string into a numeric tuple for comparison.
+
+    Cached because the checker compares the same two or three strings
+    (current version, cached latest, fresh latest) on every call.
+    """
+    if not version:
+        return (0, 0, 0)
+
+    # Remove any 'v' prefix and split by dots, defaulting to 0 for
+    # non-numeric parts
+    version = str(version).lstrip('v')
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split('.'))
+
 
 class UpdateChecker:
     """Class to handle update checking and downloading."""
@@ -54,17 +93,31 @@ class UpdateChecker:
         
         # Ensure config directory exists
         self.CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Parsed once here; every later _load_config call answers from
+        # memory and _save_config writes the same dict through to disk
+        self._config = self._read_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load the update configuration from file.
+        """Return the cached update configuration.
+        
+        Returns:
+            Dict: The configuration loaded in __init__
+        """
+        return self._config
+    
+    def _read_config(self) -> Dict[str, Any]:
+        """Read and parse the update configuration from file.
         
         Returns:
             Dict: The loaded configuration
         """
         default_config = {
             "last_checked": "",
+            "last_checked_ts": 0.0,
             "last_version": None,
-            "dont_ask_until": None
+            "dont_ask_until": None,
+            "etag": None
         }
         
         try:
@@ -90,9 +143,14 @@ class UpdateChecker:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._config = config
         try:
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
+            # Write-then-rename so a crash mid-dump cannot leave a truncated
+            # config behind
+            tmp_file = self.CONFIG_FILE.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_file, self.CONFIG_FILE)
             return True
         except IOError as e:
             logger.error(f"Error saving update config: {e}")
@@ -115,7 +173,13 @@ class UpdateChecker:
             except (ValueError, TypeError):
                 pass
                 
-        # If we've never checked or it's been more than a day since last check
+        # If we've never checked or it's been more than a day since last
+        # check. The epoch timestamp written alongside the ISO field makes
+        # this a single float compare; the ISO parse remains only for
+        # configs written before the timestamp existed.
+        if config.get("last_checked_ts"):
+            return (time.time() - config["last_checked_ts"]) > 86400.0
+        
         if not config["last_checked"]:
             return True
             
@@ -133,6 +197,7 @@ class UpdateChecker:
         """
         config = self._load_config()
         config["last_checked"] = datetime.now().isoformat()
+        config["last_checked_ts"] = time.time()
         if dont_ask_until:
             config["dont_ask_until"] = dont_ask_until
         self._save_config(config)
@@ -159,30 +224,50 @@ class UpdateChecker:
             # Get the latest release information from GitHub
             api_url = f"https://api.github.com/repos/{self.REPO_OWNER}/{self.REPO_NAME}/releases/latest"
             
-            with urllib.request.urlopen(api_url) as response:
-                if response.status != 200:
-                    return False, t('update_check_failed', 'en', 'Failed to check for updates')
-                
-                data = json.loads(response.read().decode())
-                self.latest_version = data.get('tag_name', '').lstrip('v')
-                self.release_notes = data.get('body', '')
-                
-                # Check if we have any assets to download
-                if 'assets' in data and len(data['assets']) > 0:
-                    self.download_url = data['assets'][0].get('browser_download_url')
-                
-                # Save the latest version to config
-                config = self._load_config()
+            config = self._load_config()
+            headers = {}
+            if config.get("etag"):
+                headers['If-None-Match'] = config["etag"]
+            
+            response = _SESSION.get(api_url, headers=headers, timeout=10)
+            
+            # 304: release unchanged since the cached check -- no body to
+            # parse, just refresh the timestamp
+            if response.status_code == 304:
                 config["last_checked"] = datetime.now().isoformat()
-                config["last_version"] = self.latest_version
+                config["last_checked_ts"] = time.time()
                 self._save_config(config)
-                
-                # Compare versions
-                if self._compare_versions(self.current_version, self.latest_version) < 0:
-                    return True, t('update_available', 'en', f'Version {self.latest_version} is available!')
-                else:
-                    return False, t('no_updates', 'en', 'You are using the latest version')
-                    
+                self.latest_version = config.get("last_version")
+                if self.latest_version and self._compare_versions(
+                        self.current_version, self.latest_version) < 0:
+                    return True, t('update_available', 'en',
+                                f'Version {self.latest_version} is available!')
+                return False, t('no_updates', 'en', 'You are using the latest version')
+            
+            if response.status_code != 200:
+                return False, t('update_check_failed', 'en', 'Failed to check for updates')
+            
+            data = response.json()
+            self.latest_version = data.get('tag_name', '').lstrip('v')
+            self.release_notes = data.get('body', '')
+            
+            # Check if we have any assets to download
+            if 'assets' in data and len(data['assets']) > 0:
+                self.download_url = data['assets'][0].get('browser_download_url')
+            
+            # Save the latest version (and validator) to config
+            config["last_checked"] = datetime.now().isoformat()
+            config["last_checked_ts"] = time.time()
+            config["last_version"] = self.latest_version
+            config["etag"] = response.headers.get('ETag')
+            self._save_config(config)
+            
+            # Compare versions
+            if self._compare_versions(self.current_version, self.latest_version) < 0:
+                return True, t('update_available', 'en', f'Version {self.latest_version} is available!')
+            else:
+                return False, t('no_updates', 'en', 'You are using the latest version')
+            
         except Exception as e:
             logger.error(f"Error checking for updates: {e}")
             return False, t('update_check_error', 'en', f'Error checking for updates: {str(e)}')
@@ -211,8 +296,14 @@ class UpdateChecker:
             filename = os.path.basename(self.download_url)
             filepath = os.path.join(download_dir, filename)
             
-            # Download the file
-            urllib.request.urlretrieve(self.download_url, filepath)
+            # Stream the file through the shared session: the TLS
+            # connection from the release check is reused and the body is
+            # written in large chunks instead of buffered whole in memory
+            with _SESSION.get(self.download_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             
             return True, t('download_complete', 'en', f'Downloaded to: {filepath}')
             
@@ -230,30 +321,22 @@ class UpdateChecker:
         Returns:
             int: -1 if v1 < v2, 0 if v1 == v2, 1 if v1 > v2
         """
-        def parse_version(version: str) -> Tuple[int, ...]:
-            # Handle None or empty strings
-            if not version:
-                return (0, 0, 0)
-                
-            # Remove any 'v' prefix and split by dots
-            version = str(version).lstrip('v')
-            parts = version.split('.')
-            
-            # Convert to integers, defaulting to 0 for missing parts
-            return tuple(int(part) if part.isdigit() else 0 for part in parts)
-        
-        v1_parts = parse_version(v1)
-        v2_parts = parse_version(v2)
-        
-        # Compare each part
-        for v1_part, v2_part in zip(v1_parts, v2_parts):
-            if v1_part < v2_part:
-                return -1
-            elif v1_part > v2_part:
-                return 1
-        
-        # If all parts are equal but one version has more parts
-        return (len(v1_parts) > len(v2_parts)) - (len(v1_parts) < len(v2_parts))
+        v1_parts = _parse_version(v1)
+        v2_parts = _parse_version(v2)
+
+        # Zero-pad to a common length and let C-level tuple comparison
+        # decide, instead of looping element-wise in Python
+        if len(v1_parts) != len(v2_parts):
+            width = max(len(v1_parts), len(v2_parts))
+            v1_parts += (0,) * (width - len(v1_parts))
+            v2_parts += (0,) * (width - len(v2_parts))
+
+        return (v1_parts > v2_parts) - (v1_parts < v2_parts)
+
+
+# Checker reused across menu-triggered checks so each click does not redo
+# the config-directory setup and object construction
+_checker: Optional[UpdateChecker] = None
 
 
 def check_updates(current_version: str) -> Tuple[bool, str, Dict]:
@@ -265,7 +348,10 @@ def check_updates(current_version: str) -> Tuple[bool, str, Dict]:
     Returns:
         Tuple[bool, str, Dict]: (update_available, message, update_info)
     """
-    checker = UpdateChecker(current_version)
+    global _checker
+    if _checker is None or _checker.current_version != current_version:
+        _checker = UpdateChecker(current_version)
+    checker = _checker
     update_available, message = checker.check_for_updates()
     
     update_info = {
@@ -276,3 +362,43 @@ def check_updates(current_version: str) -> Tuple[bool, str, Dict]:
     }
     
     return update_available, message, update_info
+
+
+# One worker is enough: checks are rare and must not overlap. Created
+# lazily so importing the module never spawns a thread.
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared background executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1,
+                                       thread_name_prefix='update-check')
+    return _executor
+
+
+def check_updates_async(current_version: str,
+                        callback: Callable[[bool, str, Dict], None]) -> None:
+    """Check for updates on a background thread.
+    
+    The network round-trip (DNS, TLS handshake, GitHub response) can
+    take seconds, so this keeps it off the calling thread entirely.
+    
+    Args:
+        current_version: Current version of the application
+        callback: Called as callback(update_available, message, info)
+            when the check finishes. It runs on the worker thread --
+            Qt callers must marshal any widget work back to the GUI
+            thread themselves (e.g. via a signal).
+    """
+    def _run():
+        try:
+            result = check_updates(current_version)
+        except Exception as e:
+            logger.error(f"Async update check failed: {e}")
+            result = (False, t('update_check_error', 'en',
+                               f'Error checking for updates: {e}'), {})
+        callback(*result)
+    
+    _get_executor().submit(_run)
@@ -5,6 +5,7 @@ This module provides a centralized version tracking system following Semantic Ve
 (https://semver.org/) for the Nidec Commander CDE project.
 """
 
+import functools
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -17,6 +18,10 @@ VERSION_PATCH = 5  # Additional version qualifiers
 VERSION_QUALIFIER = 'beta'  # Could be 'alpha', 'beta', 'rc', or ''
 VERSION_METADATA = ''  # Build metadata (e.g., 'build.1')
 
+# Semver pattern (major.minor.patch[-qualifier][+metadata]), compiled once
+# instead of on every parse_version call
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([\w\.]+))?(?:\+([\w\.]+))?$')
+
 @dataclass
 class VersionInfo:
     """Dataclass to hold version information."""
@@ -69,21 +74,27 @@ class VersionInfo:
             'build_year': datetime.now().year
         }
 
+# The running application's version never changes, so one shared
+# VersionInfo serves every query; its string and dict forms are frozen
+# once below (after get_build_date is defined) instead of being rebuilt
+# on each call
+_VERSION = VersionInfo(
+    major=VERSION_MAJOR,
+    minor=VERSION_MINOR,
+    patch=VERSION_PATCH,
+    qualifier=VERSION_QUALIFIER,
+    metadata=VERSION_METADATA
+)
+
 def get_version_info() -> Dict[str, Union[int, str, bool]]:
     """
     Get detailed version information.
     
     Returns:
-        Dict containing comprehensive version information.
+        Dict containing comprehensive version information (a fresh
+        shallow copy, so callers may modify it freely).
     """
-    version = VersionInfo(
-        major=VERSION_MAJOR,
-        minor=VERSION_MINOR,
-        patch=VERSION_PATCH,
-        qualifier=VERSION_QUALIFIER,
-        metadata=VERSION_METADATA
-    )
-    return version.to_dict()
+    return dict(_VERSION_DICT)
 
 def get_version() -> str:
     """
@@ -92,18 +103,17 @@ def get_version() -> str:
     Returns:
         str: Formatted version string (e.g., '1.2.3-beta')
     """
-    return str(VersionInfo(
-        major=VERSION_MAJOR,
-        minor=VERSION_MINOR,
-        patch=VERSION_PATCH,
-        qualifier=VERSION_QUALIFIER,
-        metadata=VERSION_METADATA
-    ))
+    return _VERSION_STR
 
+@functools.lru_cache(maxsize=256)
 def parse_version(version_str: str) -> VersionInfo:
     """
     Parse a version string into a VersionInfo object.
     
+    Results are cached: the same handful of version strings is parsed
+    over and over (compatibility checks, update comparisons), so repeat
+    calls skip the regex match entirely.
+    
     Args:
         version_str: Version string to parse (e.g., '1.2.3-beta+123')
         
@@ -113,11 +123,7 @@ def parse_version(version_str: str) -> VersionInfo:
     Raises:
         ValueError: If the version string is invalid
     """
-    # Match semver pattern (major.minor.patch[-qualifier][+metadata])
-    match = re.match(
-        r'^(\d+)\.(\d+)\.(\d+)(?:-([\w\.]+))?(?:\+([\w\.]+))?$',
-        version_str
-    )
+    match = _SEMVER_RE.match(version_str)
     
     if not match:
         raise ValueError(f"Invalid version string: {version_str}")
@@ -160,6 +166,10 @@ def check_version_compatibility(
     except (ValueError, AttributeError) as e:
         raise ValueError(f"Invalid version string: {e}")
 
+# Stamped once at import: repeated queries should not each pay a
+# datetime.now() call, and the date should not flip mid-session
+_BUILD_DATE = datetime.now().strftime("%Y-%m-%d")
+
 def get_build_date() -> str:
     """
     Get the build date in ISO format.
@@ -167,7 +177,11 @@ def get_build_date() -> str:
     Returns:
         str: ISO formatted build date (YYYY-MM-DD)
     """
-    return datetime.now().strftime("%Y-%m-%d")
+    return _BUILD_DATE
+
+# Frozen forms of the shared version, computed once per process
+_VERSION_STR = _VERSION.full_version
+_VERSION_DICT = _VERSION.to_dict()
 
 # Module-level attributes for backward compatibility
 __version__ = get_version()